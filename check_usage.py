@@ -2,24 +2,49 @@
 API Usage Monitor
 Quick script to check your current API usage
 """
-import json
+import sys
 from pathlib import Path
+
+import orjson
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent / "dashboard"))
+from components.thresholds import usage_level
+
+STATUS_TEXT = {
+    "GOOD": "🟢 GOOD - Within Safe Range",
+    "CAUTION": "🟠 CAUTION - Approaching Limit",
+    "WARNING": "🟡 WARNING - Over Soft Limit",
+    "CRITICAL": "🔴 CRITICAL - At/Over Hard Limit!",
+}
+
 
 def main():
-    usage_file = Path("data/api_usage_log.json")
+    data_dir = Path("data")
+    counts_file = data_dir / "api_usage_counts.json"
+    log_file = data_dir / "api_usage_log.jsonl"
+    legacy_file = data_dir / "api_usage_log.json"
 
-    if not usage_file.exists():
+    if counts_file.exists():
+        monthly_counts = orjson.loads(counts_file.read_bytes())
+        recent = []
+        if log_file.exists():
+            recent = [
+                orjson.loads(line)
+                for line in log_file.read_bytes().splitlines()[-10:]
+            ]
+    elif legacy_file.exists():
+        # Pre-JSONL layout: one file holding both requests and counts
+        usage_log = orjson.loads(legacy_file.read_bytes())
+        monthly_counts = usage_log["monthly_counts"]
+        recent = usage_log["requests"][-10:]
+    else:
         print("No API usage data found yet.")
         print("Run quickstart.py or make some API calls first.")
         return
 
-    with open(usage_file, 'r') as f:
-        usage_log = json.load(f)
-
     current_month = datetime.now().strftime("%Y-%m")
-    current_usage = usage_log["monthly_counts"].get(current_month, 0)
+    current_usage = monthly_counts.get(current_month, 0)
 
     # Limits
     soft_limit = 2000
@@ -35,20 +60,11 @@ def main():
     print(f"\nRemaining:     {hard_limit - current_usage}")
     print(f"Usage:         {(current_usage/soft_limit)*100:.1f}% of soft limit")
 
-    # Status indicator
-    if current_usage >= hard_limit:
-        status = "🔴 CRITICAL - At/Over Hard Limit!"
-    elif current_usage >= soft_limit:
-        status = "🟡 WARNING - Over Soft Limit"
-    elif current_usage >= soft_limit * 0.8:
-        status = "🟠 CAUTION - Approaching Limit"
-    else:
-        status = "🟢 GOOD - Within Safe Range"
-
-    print(f"\nStatus: {status}")
+    # Status indicator (shared threshold table with the dashboard badge)
+    _, level = usage_level(current_usage)
+    print(f"\nStatus: {STATUS_TEXT[level]}")
 
     # Recent requests
-    recent = usage_log["requests"][-10:]
     if recent:
         print("\n" + "=" * 60)
         print("Recent Requests (last 10):")
@@ -62,7 +78,7 @@ def main():
     print("\n" + "=" * 60)
     print("Monthly Usage History:")
     print("=" * 60)
-    for month, count in sorted(usage_log["monthly_counts"].items()):
+    for month, count in sorted(monthly_counts.items()):
         indicator = "←" if month == current_month else ""
         print(f"{month}: {count:4d} requests {indicator}")
 
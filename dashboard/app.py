@@ -4,11 +4,27 @@ Entry point for the Streamlit app.
 """
 import streamlit as st
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from components.thresholds import usage_level
+
+
+@lru_cache(maxsize=8)
+def _api_badge_html(usage, budget):
+    """Sidebar API-usage badge; usage changes rarely, so cache the HTML."""
+    pct = usage / budget * 100
+    color, _ = usage_level(usage)
+    return (
+        f'<div style="background:{color}22; border:1px solid {color}; border-radius:8px; '
+        f'padding:6px 12px; text-align:center; margin-top:8px;">'
+        f'<span style="color:{color}; font-weight:600; font-size:0.85rem;">'
+        f'🔑 API: {usage:,} / {budget:,} ({pct:.1f}%)</span></div>'
+    )
+
 st.set_page_config(
     page_title="PowerStack Labs | Market Intel",
     page_icon="📊",
@@ -27,28 +43,32 @@ if st.sidebar.button(
     use_container_width=True,
     type="primary" if st.session_state.page == "rankings" else "secondary"
 ):
-    st.session_state.page = "rankings"
-    if "selected_app_id" in st.session_state:
-        del st.session_state.selected_app_id
-    st.rerun()
+    # Only rerun when the click actually changes the page
+    if st.session_state.page != "rankings":
+        st.session_state.page = "rankings"
+        if "selected_app_id" in st.session_state:
+            del st.session_state.selected_app_id
+        st.rerun()
 
 if st.sidebar.button(
     "💡 Opportunities",
     use_container_width=True,
     type="primary" if st.session_state.page == "opportunities" else "secondary"
 ):
-    st.session_state.page = "opportunities"
-    if "selected_app_id" in st.session_state:
-        del st.session_state.selected_app_id
-    st.rerun()
+    if st.session_state.page != "opportunities":
+        st.session_state.page = "opportunities"
+        if "selected_app_id" in st.session_state:
+            del st.session_state.selected_app_id
+        st.rerun()
 
 if st.sidebar.button(
     "🔍 App Details",
     use_container_width=True,
     type="primary" if st.session_state.page == "app_details" else "secondary"
 ):
-    st.session_state.page = "app_details"
-    st.rerun()
+    if st.session_state.page != "app_details":
+        st.session_state.page = "app_details"
+        st.rerun()
 
 st.sidebar.divider()
 
@@ -67,28 +87,13 @@ st.sidebar.markdown(
 from components.data_loader import load_metadata
 meta = load_metadata()
 if meta:
-    last_refresh = meta.get("last_refresh", "Unknown")[:16].replace("T", " ")
-    st.sidebar.caption(f"Last updated: {last_refresh}")
+    st.sidebar.caption(f"Last updated: {meta['_last_refresh_display']}")
     st.sidebar.caption(f"Apps tracked: {meta.get('total_apps', '?')}")
-    st.sidebar.caption(f"Platform: {meta.get('platform', 'iOS')} • {meta.get('country', 'US')}")
+    st.sidebar.caption(f"Platform: {meta['_platform_country_display']}")
 
     # API usage counter
     usage = meta.get("api_usage_monthly", 0)
-    budget = 2500
-    pct = usage / budget * 100
-    if usage >= 2000:
-        color = "#FF4B4B"
-    elif usage >= 1500:
-        color = "#FFA500"
-    else:
-        color = "#4CAF50"
-    st.sidebar.markdown(
-        f'<div style="background:{color}22; border:1px solid {color}; border-radius:8px; '
-        f'padding:6px 12px; text-align:center; margin-top:8px;">'
-        f'<span style="color:{color}; font-weight:600; font-size:0.85rem;">'
-        f'🔑 API: {usage:,} / {budget:,} ({pct:.1f}%)</span></div>',
-        unsafe_allow_html=True,
-    )
+    st.sidebar.markdown(_api_badge_html(usage, 2500), unsafe_allow_html=True)
 
 st.sidebar.divider()
 
@@ -1,6 +1,9 @@
 """Reusable Plotly chart builders for the dashboard."""
-import plotly.express as px
+import heapq
+
+import numpy as np
 import plotly.graph_objects as go
+import streamlit as st
 from .formatters import fmt_money, fmt_number
 
 
@@ -17,24 +20,31 @@ CHART_BG = "rgba(0,0,0,0)"
 PAPER_BG = "rgba(0,0,0,0)"
 
 
+# Built once at import; every figure starts from this dark theme
+_GRID = dict(gridcolor="rgba(255,255,255,0.1)", zerolinecolor="rgba(255,255,255,0.1)")
+_BASE_LAYOUT = dict(
+    plot_bgcolor=CHART_BG,
+    paper_bgcolor=PAPER_BG,
+    font=dict(color="#FAFAFA", size=13),
+    margin=dict(l=20, r=20, t=20, b=20),
+    legend=dict(
+        bgcolor="rgba(0,0,0,0)",
+        font=dict(color="#FAFAFA"),
+    ),
+    xaxis=_GRID,
+    yaxis=_GRID,
+)
+
+
 def _base_layout(fig, title=None):
-    """Apply consistent dark theme to a Plotly figure."""
-    fig.update_layout(
-        title=title,
-        plot_bgcolor=CHART_BG,
-        paper_bgcolor=PAPER_BG,
-        font=dict(color="#FAFAFA", size=13),
-        margin=dict(l=20, r=20, t=40 if title else 20, b=20),
-        legend=dict(
-            bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#FAFAFA"),
-        ),
-    )
-    fig.update_xaxes(gridcolor="rgba(255,255,255,0.1)", zerolinecolor="rgba(255,255,255,0.1)")
-    fig.update_yaxes(gridcolor="rgba(255,255,255,0.1)", zerolinecolor="rgba(255,255,255,0.1)")
+    """Apply consistent dark theme to a Plotly figure in one update pass."""
+    fig.update_layout(_BASE_LAYOUT)
+    if title:
+        fig.update_layout(title=title, margin=dict(l=20, r=20, t=40, b=20))
     return fig
 
 
+@st.cache_data(ttl=300)
 def revenue_by_category_bar(cat_summary):
     """Horizontal bar chart of revenue by category."""
     cats = list(cat_summary.keys())
@@ -49,8 +59,7 @@ def revenue_by_category_bar(cat_summary):
         text=[fmt_money(r) for r in revenues],
         textposition="auto",
         textfont=dict(color="white"),
-    ))
-    _base_layout(fig)
+    ), layout=_BASE_LAYOUT)
     fig.update_layout(
         yaxis=dict(autorange="reversed"),
         height=300,
@@ -59,6 +68,7 @@ def revenue_by_category_bar(cat_summary):
     return fig
 
 
+@st.cache_data(ttl=300)
 def downloads_by_category_bar(cat_summary):
     """Horizontal bar chart of downloads by category."""
     cats = list(cat_summary.keys())
@@ -73,8 +83,7 @@ def downloads_by_category_bar(cat_summary):
         text=[fmt_number(d) for d in downloads],
         textposition="auto",
         textfont=dict(color="white"),
-    ))
-    _base_layout(fig)
+    ), layout=_BASE_LAYOUT)
     fig.update_layout(
         yaxis=dict(autorange="reversed"),
         height=300,
@@ -83,9 +92,10 @@ def downloads_by_category_bar(cat_summary):
     return fig
 
 
+@st.cache_data(ttl=300)
 def top_apps_revenue_bar(apps, n=10):
     """Horizontal bar chart of top N apps by revenue."""
-    sorted_apps = sorted(apps, key=lambda x: x.get("revenue", 0), reverse=True)[:n]
+    sorted_apps = heapq.nlargest(n, apps, key=lambda x: x.get("revenue", 0))
     sorted_apps.reverse()  # Plotly renders bottom-up
 
     names = [a["name"][:25] for a in sorted_apps]
@@ -99,15 +109,18 @@ def top_apps_revenue_bar(apps, n=10):
         text=[fmt_money(r) for r in revenues],
         textposition="auto",
         textfont=dict(color="white"),
-    ))
-    _base_layout(fig)
+    ), layout=_BASE_LAYOUT)
     fig.update_layout(height=max(300, n * 35))
     return fig
 
 
+@st.cache_data(ttl=300)
 def publisher_treemap(pub_summary, n=20):
     """Treemap of top publishers by revenue."""
-    top = sorted(pub_summary, key=lambda x: x["total_revenue"], reverse=True)[:n]
+    # plotly.express is only needed here; defer the heavy import
+    import plotly.express as px
+
+    top = heapq.nlargest(n, pub_summary, key=lambda x: x["total_revenue"])
     top = [p for p in top if p["total_revenue"] > 0]
 
     if not top:
@@ -137,7 +150,8 @@ def trends_line_chart(trends_data, metric="grossing_revenue"):
     for cat_name, cat_data in trends_data.get("categories", {}).items():
         values = cat_data.get(metric, [])
         if values:
-            fig.add_trace(go.Scatter(
+            # WebGL traces keep the client responsive as the history grows
+            fig.add_trace(go.Scattergl(
                 x=trends_data["dates"],
                 y=values,
                 name=cat_name,
@@ -146,7 +160,8 @@ def trends_line_chart(trends_data, metric="grossing_revenue"):
             ))
 
     _base_layout(fig)
-    fig.update_layout(height=400)
+    # Keep zoom/pan state across Streamlit reruns instead of re-plotting
+    fig.update_layout(height=400, uirevision="trends")
     return fig
 
 
@@ -158,20 +173,16 @@ def radar_chart(apps_data):
     metrics = ["rating", "revenue", "downloads", "global_rating_count"]
     metric_labels = ["Rating", "Revenue", "Downloads", "Total Ratings"]
 
-    # Normalize each metric to 0-1
-    max_vals = {}
-    for m in metrics:
-        vals = [a.get(m, 0) for a in apps_data]
-        max_vals[m] = max(vals) if max(vals) > 0 else 1
+    # Normalize each metric to 0-1 in one vectorized pass
+    arr = np.array([[a.get(m, 0) for m in metrics] for a in apps_data], dtype=np.float64)
+    maxes = arr.max(axis=0)
+    normed = arr / np.where(maxes > 0, maxes, 1.0)
 
+    labels = metric_labels + [metric_labels[0]]
     fig = go.Figure()
-    for app in apps_data:
-        values = [app.get(m, 0) / max_vals[m] for m in metrics]
-        values.append(values[0])  # Close the shape
-        labels = metric_labels + [metric_labels[0]]
-
+    for i, app in enumerate(apps_data):
         fig.add_trace(go.Scatterpolar(
-            r=values,
+            r=np.append(normed[i], normed[i, 0]),  # Close the shape
             theta=labels,
             fill="toself",
             name=app.get("name", "Unknown")[:20],
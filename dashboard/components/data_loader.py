@@ -1,51 +1,171 @@
 """Load dashboard data with Streamlit caching."""
-import json
+import heapq
+import mmap
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+import numpy as np
+import orjson
+import pandas as pd
 import streamlit as st
 
 DATA_DIR = Path(__file__).parent.parent.parent / "dashboard_data"
 
 
-@st.cache_data(ttl=300)
+def _mtime(path):
+    """Stat-based cache key so refreshed files invalidate before the TTL."""
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+# Above this size, mmap the file so the kernel pages bytes in on demand
+# instead of copying the whole payload before parsing
+_MMAP_MIN_BYTES = 5 * 1024 * 1024
+
+
+@st.cache_resource(ttl=300)
+def _load_json(path_str, mtime):
+    path = Path(path_str)
+    if path.stat().st_size >= _MMAP_MIN_BYTES:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            # orjson only accepts bytes-like input; memoryview wraps the
+            # mapping without copying it
+            return orjson.loads(memoryview(buf))
+    return orjson.loads(path.read_bytes())
+
+
+def _read_current(name):
+    path = DATA_DIR / "current" / name
+    return _load_json(str(path), _mtime(path))
+
+
 def load_rankings():
-    with open(DATA_DIR / "current" / "rankings.json") as f:
-        return json.load(f)
+    return _read_current("rankings.json")
 
 
-@st.cache_data(ttl=300)
 def load_app_details():
-    with open(DATA_DIR / "current" / "app_details.json") as f:
-        return json.load(f)
+    path = DATA_DIR / "current" / "app_details.json"
+    return _app_details_processed(_mtime(path))
+
+
+@st.cache_resource(ttl=300)
+def _app_details_processed(mtime):
+    """App details keyed by str(app_id) so lookups never re-cast per row.
+
+    App age is derived here, once per load, so pages read a plain float
+    instead of re-parsing release_date ISO strings on every rerun.
+    """
+    raw = orjson.loads((DATA_DIR / "current" / "app_details.json").read_bytes())
+    now_utc = datetime.now(timezone.utc)
+    now_naive = now_utc.replace(tzinfo=None)
+    for app in raw.values():
+        age = None
+        release_str = app.get("release_date")
+        if release_str:
+            try:
+                release_dt = datetime.fromisoformat(release_str.replace("Z", "+00:00"))
+                now = now_utc if release_dt.tzinfo else now_naive
+                age = round((now - release_dt).days / 365.25, 1)
+            except (ValueError, TypeError):
+                pass
+        app["_app_age_years"] = age
+    return {str(k): v for k, v in raw.items()}
 
 
-@st.cache_data(ttl=300)
 def load_category_summary():
-    with open(DATA_DIR / "current" / "category_summary.json") as f:
-        return json.load(f)
+    return _read_current("category_summary.json")
 
 
-@st.cache_data(ttl=300)
 def load_publisher_summary():
-    with open(DATA_DIR / "current" / "publisher_summary.json") as f:
-        return json.load(f)
+    return _read_current("publisher_summary.json")
+
+
+@st.cache_resource(ttl=300)
+def load_publisher_arrays():
+    """Publisher summary as columnar NumPy arrays.
+
+    Sums, sorts and top-k selections over these run as C-level reductions;
+    the list-of-dicts view from load_publisher_summary stays available for
+    record-shaped consumers.
+    """
+    pubs = load_publisher_summary()
+    return {
+        "publisher_name": np.array([p.get("publisher_name", "") for p in pubs], dtype=object),
+        "app_count": np.array([p.get("app_count", 0) for p in pubs], dtype=np.int64),
+        "chart_appearances": np.array([p.get("chart_appearances", 0) for p in pubs], dtype=np.int64),
+        "total_revenue": np.array([p.get("total_revenue", 0) or 0 for p in pubs], dtype=np.int64),
+        "total_downloads": np.array([p.get("total_downloads", 0) or 0 for p in pubs], dtype=np.int64),
+        "avg_rating": np.array([p.get("avg_rating", 0) or 0 for p in pubs], dtype=np.float32),
+    }
 
 
 @st.cache_data(ttl=300)
+def load_top_publishers(sort_key="total_revenue", n=50):
+    """Top-n publisher summaries by the given key, memoized per sort key."""
+    pubs = load_publisher_summary()
+    return heapq.nlargest(n, pubs, key=lambda p: p.get(sort_key, 0) or 0)
+
+
 def load_trends():
     path = DATA_DIR / "historical" / "trends.json"
     if path.exists():
-        with open(path) as f:
-            return json.load(f)
+        return _load_json(str(path), _mtime(path))
     return {"dates": [], "categories": {}}
 
 
 @st.cache_data(ttl=300)
+def load_trend_summary():
+    """Latest trend point and percent change per category, one vectorized pass.
+
+    Returns a DataFrame indexed by category with <metric>_latest and
+    <metric>_change_pct columns for each tracked metric.
+    """
+    trends = load_trends()
+    cats = trends.get("categories", {})
+    if not cats or len(trends.get("dates", [])) < 2:
+        return pd.DataFrame()
+
+    data = {}
+    for metric in ("grossing_revenue", "grossing_downloads", "free_downloads"):
+        series = [cats[c].get(metric) or [0] for c in cats]
+        latest = np.array([s[-1] for s in series], dtype=np.float64)
+        previous = np.array([s[-2] if len(s) >= 2 else 0 for s in series], dtype=np.float64)
+        # branchless zero-previous handling instead of per-category ifs
+        change = np.divide(
+            latest - previous, previous,
+            out=np.zeros_like(latest), where=previous != 0,
+        ) * 100
+        data[f"{metric}_latest"] = latest
+        data[f"{metric}_change_pct"] = change
+
+    return pd.DataFrame(data, index=list(cats))
+
+
 def load_metadata():
     path = DATA_DIR / "metadata.json"
-    if path.exists():
-        with open(path) as f:
-            return json.load(f)
-    return {}
+    return _metadata_processed(_mtime(path))
+
+
+@st.cache_resource(ttl=300)
+def _metadata_processed(mtime):
+    path = DATA_DIR / "metadata.json"
+    if not path.exists():
+        return {}
+    meta = orjson.loads(path.read_bytes())
+    # Pre-derive the sidebar display strings so app.py reads them as-is
+    meta["_last_refresh_display"] = meta.get("last_refresh", "Unknown")[:16].replace("T", " ")
+    meta["_platform_country_display"] = f"{meta.get('platform', 'iOS')} • {meta.get('country', 'US')}"
+    return meta
+
+
+@st.cache_data(ttl=300)
+def load_top_apps_by_revenue(n=100):
+    """Top-n app detail records sorted by revenue, cached across reruns."""
+    details = load_app_details()
+    return sorted(
+        details.values(), key=lambda x: x.get("revenue", 0) or 0, reverse=True
+    )[:n]
 
 
 def get_app_by_id(app_id):
@@ -54,15 +174,79 @@ def get_app_by_id(app_id):
     return details.get(str(app_id), {})
 
 
+@st.cache_data(ttl=300)
 def get_all_apps_list():
-    """Return a list of (app_id, name) tuples sorted by name."""
-    details = load_app_details()
-    apps = [(aid, a["name"]) for aid, a in details.items()]
-    apps.sort(key=lambda x: x[1])
-    return apps
+    """Return (app_id, label) tuples sorted by name.
+
+    Labels are "name — publisher", built in one str.cat pass instead of a
+    per-app f-string loop.
+    """
+    df = load_all_apps_df().drop_duplicates("app_id").sort_values("name")
+    labels = df["name"].str.cat(df["publisher_name"].fillna(""), sep=" — ")
+    return list(zip(df["app_id"], labels))
+
+
+@st.cache_data(ttl=300)
+def get_name_to_id():
+    """Label → app_id map for selection widgets, built once per data load."""
+    return {label: aid for aid, label in get_all_apps_list()}
+
+
+@st.cache_data(ttl=300)
+def get_filter_vocab():
+    """Sorted category and chart-type options, computed once for every page."""
+    df = load_all_apps_df()
+    return (
+        df["category"].cat.categories.tolist(),
+        df["chart_type"].cat.categories.tolist(),
+    )
 
 
 @st.cache_data(ttl=300)
+def load_review_counts():
+    """rating_count per app_id as a string-indexed Series for vectorized joins."""
+    details = load_app_details()
+    return pd.Series(
+        {aid: d.get("rating_count", 0) or 0 for aid, d in details.items()},
+        dtype="int64",
+    )
+
+
 def load_all_apps_table():
-    with open(DATA_DIR / "current" / "all_apps_table.json") as f:
-        return json.load(f)
+    return _read_current("all_apps_table.json")
+
+
+# Period columns that pages filter and sort on
+PERIOD_COLS = [
+    "downloads_1m", "revenue_1m",
+    "downloads_3m", "revenue_3m",
+    "downloads_6m", "revenue_6m",
+]
+
+# Columns the dashboard tables actually use; skips icon_url/charts/etc.
+TABLE_COLS = [
+    "app_id", "name", "publisher_name", "category", "chart_type",
+    "rank", "rating", "revenue", "downloads", "has_iap", "price",
+    "release_date", "updated_date", "app_age_years",
+] + PERIOD_COLS
+
+
+@st.cache_data(ttl=300)
+def load_all_apps_df():
+    """All-apps table as a typed DataFrame so pages can filter/sort vectorized."""
+    data = load_all_apps_table()
+    # Pivot straight into columns instead of letting pandas infer row-by-row
+    df = pd.DataFrame({k: [d.get(k) for d in data] for k in TABLE_COLS})
+    for col in PERIOD_COLS + ["revenue", "downloads"]:
+        # JSON nulls leave the column as object dtype; coerce so nlargest works
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype("int64")
+    df["rating"] = pd.to_numeric(df["rating"], errors="coerce").fillna(0).astype("float32")
+    # Few distinct values repeated across thousands of rows: store as codes
+    df["category"] = df["category"].astype("category")
+    df["chart_type"] = df["chart_type"].astype("category")
+    # Staleness doesn't change between reruns, so compute it once here
+    # as a single datetime64 vector compare rather than per-row string slices
+    df["updated_dt"] = pd.to_datetime(df["updated_date"].str[:10], errors="coerce")
+    cutoff = pd.Timestamp(datetime.now() - timedelta(days=365))
+    df["is_stale"] = df["updated_dt"].notna() & (df["updated_dt"] <= cutoff)
+    return df
@@ -0,0 +1,32 @@
+"""Shared sidebar filters and period helpers for the table pages."""
+import streamlit as st
+
+from .data_loader import get_filter_vocab
+
+PERIOD_MAP = {
+    "Last Month": ("downloads_1m", "revenue_1m"),
+    "Last 3 Months": ("downloads_3m", "revenue_3m"),
+    "Last 6 Months": ("downloads_6m", "revenue_6m"),
+}
+
+
+def get_period_label(base_label, selected_period):
+    """Generate dynamic column header: 'Downloads Last Month'"""
+    period_suffix = selected_period.replace("Last ", "")
+    return f"{base_label} {period_suffix}"
+
+
+def sidebar_filters():
+    """Render the category/chart/period sidebar block used by both table pages."""
+    all_categories, all_chart_types = get_filter_vocab()
+
+    selected_categories = st.sidebar.multiselect(
+        "Category", all_categories, placeholder="All categories"
+    )
+    chart_options = ["All"] + all_chart_types
+    selected_chart = st.sidebar.selectbox("Chart Type", chart_options)
+
+    st.sidebar.divider()
+    selected_period = st.sidebar.selectbox("Period", list(PERIOD_MAP.keys()))
+
+    return selected_categories, selected_chart, selected_period
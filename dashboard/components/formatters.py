@@ -1,6 +1,10 @@
 """Number and date formatting helpers for the dashboard."""
+from functools import lru_cache
 
+import numpy as np
 
+
+@lru_cache(maxsize=4096)
 def fmt_money(val):
     """Format integer to human-readable money: 238000000 → '$238M'"""
     if val is None or val == 0:
@@ -14,6 +18,7 @@ def fmt_money(val):
     return f"${val:,.0f}"
 
 
+@lru_cache(maxsize=4096)
 def fmt_number(val):
     """Format integer to human-readable: 26000000 → '26M'"""
     if val is None or val == 0:
@@ -27,6 +32,7 @@ def fmt_number(val):
     return f"{val:,}"
 
 
+@lru_cache(maxsize=1024)
 def fmt_rating(val):
     """Format rating: 4.53077 → '4.5'"""
     if val is None or val == 0:
@@ -34,6 +40,7 @@ def fmt_rating(val):
     return f"{val:.1f}"
 
 
+@lru_cache(maxsize=1024)
 def fmt_delta(current, previous):
     """Format a delta value for st.metric: returns (formatted, delta_str)."""
     if previous is None or previous == 0:
@@ -43,6 +50,47 @@ def fmt_delta(current, previous):
     return fmt_money(current), f"{pct:+.1f}%"
 
 
+# Below this many rows the np.select setup costs more than the cached
+# scalar formatters it replaces
+_VEC_MIN_ROWS = 64
+
+
+def fmt_money_vec(s):
+    """Vectorized fmt_money over a numeric pandas Series."""
+    s = s.fillna(0)
+    if len(s) < _VEC_MIN_ROWS:
+        return np.array([fmt_money(v) for v in s], dtype=object)
+    conds = [s >= 1_000_000_000, s >= 1_000_000, s >= 1_000]
+    choices = [
+        (s / 1_000_000_000).map("${:.1f}B".format),
+        (s / 1_000_000).map("${:.0f}M".format),
+        (s / 1_000).map("${:.0f}K".format),
+    ]
+    return np.select(conds, choices, default=s.map("${:,.0f}".format))
+
+
+def fmt_number_vec(s):
+    """Vectorized fmt_number over a numeric pandas Series."""
+    s = s.fillna(0)
+    if len(s) < _VEC_MIN_ROWS:
+        return np.array([fmt_number(v) for v in s], dtype=object)
+    conds = [s >= 1_000_000_000, s >= 1_000_000, s >= 1_000]
+    choices = [
+        (s / 1_000_000_000).map("{:.1f}B".format),
+        (s / 1_000_000).map("{:.1f}M".format),
+        (s / 1_000).map("{:.0f}K".format),
+    ]
+    return np.select(conds, choices, default=s.astype("int64").map("{:,}".format))
+
+
+def fmt_rating_vec(s):
+    """Vectorized fmt_rating over a numeric pandas Series."""
+    s = s.fillna(0)
+    if len(s) < _VEC_MIN_ROWS:
+        return np.array([fmt_rating(v) for v in s], dtype=object)
+    return np.where(s > 0, s.map("{:.1f}".format), "N/A")
+
+
 CHART_TYPE_LABELS = {
     "topfreeapplications": "Top Free",
     "topgrossingapplications": "Top Grossing",
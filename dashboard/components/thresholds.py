@@ -0,0 +1,18 @@
+"""Shared API-usage thresholds for the dashboard badge and CLI tools."""
+import bisect
+
+# (min usage, badge color, status label) — keep sorted by min usage
+THRESHOLDS = [
+    (0, "#4CAF50", "GOOD"),
+    (1500, "#FFA500", "CAUTION"),
+    (2000, "#FF4B4B", "WARNING"),
+    (3000, "#B00020", "CRITICAL"),
+]
+_KEYS = [t[0] for t in THRESHOLDS]
+
+
+def usage_level(usage):
+    """Map a monthly usage count to (color, status) with one bisect lookup."""
+    idx = bisect.bisect_right(_KEYS, usage) - 1
+    _, color, status = THRESHOLDS[idx]
+    return color, status
@@ -1,81 +1,105 @@
 """Rankings page — side-by-side tables with dynamic column headers."""
-import pandas as pd
+import numpy as np
 import streamlit as st
-from components.data_loader import load_all_apps_table
-from components.formatters import fmt_money, fmt_number
+from components.data_loader import load_all_apps_df
+from components.filters import PERIOD_MAP, get_period_label, sidebar_filters
+from components.formatters import fmt_money_vec, fmt_number_vec
 
-PERIOD_MAP = {
-    "Last Month": ("downloads_1m", "revenue_1m"),
-    "Last 3 Months": ("downloads_3m", "revenue_3m"),
-    "Last 6 Months": ("downloads_6m", "revenue_6m"),
-}
 
+def _build_ranking_df(top, dl_header, rev_header, dl_field, rev_field):
+    df = top[["name", "publisher_name", "category"]].rename(columns={
+        "name": "App",
+        "publisher_name": "Publisher",
+        "category": "Category",
+    })
+    df[dl_header] = fmt_number_vec(top[dl_field])
+    df[rev_header] = fmt_money_vec(top[rev_field])
+    # Arrow-backed strings serialize straight onto Streamlit's wire format
+    return df.convert_dtypes(dtype_backend="pyarrow")
 
-def get_period_label(base_label, selected_period):
-    """Generate dynamic column header: 'Downloads Last Month'"""
-    period_suffix = selected_period.replace("Last ", "")
-    return f"{base_label} {period_suffix}"
+
+def _top_k_order(values, k):
+    """Index array of the k largest values in descending order."""
+    k = min(k, len(values))
+    idx = np.argpartition(-values, k - 1)[:k]
+    return idx[np.argsort(-values[idx], kind="stable")]
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _compute_tables(selected_categories, selected_chart, selected_period):
+    """Filter, partial-sort and format both tables, memoized per selection.
+
+    Returns (df_dl, df_rev, ids_dl, ids_rev, n_filtered) so reruns that
+    don't change the filters skip the whole pipeline.
+    """
+    dl_field, rev_field = PERIOD_MAP[selected_period]
+    apps = load_all_apps_df()
+
+    # One fused mask, one materialized frame — no chained intermediates
+    mask = np.ones(len(apps), dtype=bool)
+    if selected_categories:
+        # set membership beats list scans inside isin's hash probe
+        mask &= apps["category"].isin(set(selected_categories)).to_numpy()
+    if selected_chart != "All":
+        mask &= (apps["chart_type"] == selected_chart).to_numpy()
+    filtered = apps[mask]
+
+    if filtered.empty:
+        return None, None, [], [], 0
+
+    dl_header = get_period_label("Downloads", selected_period)
+    rev_header = get_period_label("Revenue", selected_period)
+
+    # Both orderings come from the same filtered frame: argpartition pulls
+    # the top rows in O(N), then only those get sorted
+    dl_order = _top_k_order(filtered[dl_field].to_numpy(), 50)
+    rev_order = _top_k_order(filtered[rev_field].to_numpy(), 50)
+
+    # Rows appearing in both tables get formatted exactly once; the two
+    # views are just permutations of the shared formatted frame
+    union_idx = np.union1d(dl_order, rev_order)
+    formatted = _build_ranking_df(
+        filtered.iloc[union_idx], dl_header, rev_header, dl_field, rev_field
+    )
+    pos = np.empty(len(filtered), dtype=np.int64)
+    pos[union_idx] = np.arange(len(union_idx))
+
+    app_ids = filtered["app_id"].to_numpy()
+    return (
+        formatted.iloc[pos[dl_order]].reset_index(drop=True),
+        formatted.iloc[pos[rev_order]].reset_index(drop=True),
+        app_ids[dl_order].tolist(),
+        app_ids[rev_order].tolist(),
+        len(filtered),
+    )
 
 
 def render():
     st.title("App Rankings")
 
-    apps = load_all_apps_table()
-    if not apps:
+    apps = load_all_apps_df()
+    if apps.empty:
         st.warning("No data available. Run data refresh first.")
         return
 
     # ---- Sidebar Filters ----
-    all_categories = sorted({a["category"] for a in apps})
-    all_chart_types = sorted({a["chart_type"] for a in apps})
+    selected_categories, selected_chart, selected_period = sidebar_filters()
 
-    selected_categories = st.sidebar.multiselect(
-        "Category", all_categories, placeholder="All categories"
+    df_dl, df_rev, ids_dl, ids_rev, n_filtered = _compute_tables(
+        tuple(selected_categories), selected_chart, selected_period
     )
-    chart_options = ["All"] + all_chart_types
-    selected_chart = st.sidebar.selectbox("Chart Type", chart_options)
-
-    st.sidebar.divider()
-    selected_period = st.sidebar.selectbox("Period", list(PERIOD_MAP.keys()))
-    dl_field, rev_field = PERIOD_MAP[selected_period]
-
-    # Filter
-    filtered = apps
-    if selected_categories:
-        filtered = [a for a in filtered if a["category"] in selected_categories]
-    if selected_chart != "All":
-        filtered = [a for a in filtered if a["chart_type"] == selected_chart]
 
-    if not filtered:
+    if n_filtered == 0:
         st.info("No apps match the selected filters.")
         return
 
-    # Dynamic column headers
-    dl_header = get_period_label("Downloads", selected_period)
-    rev_header = get_period_label("Revenue", selected_period)
-
-    st.caption(f"Showing top 50 of {len(filtered)} apps — click app name to view details")
-
-    def build_ranking_df(sorted_apps):
-        rows = []
-        for a in sorted_apps[:50]:
-            rows.append({
-                "App": a["name"],
-                "Publisher": a["publisher_name"],
-                "Category": a["category"],
-                dl_header: fmt_number(a.get(dl_field, 0) or 0),
-                rev_header: fmt_money(a.get(rev_field, 0) or 0),
-            })
-        return pd.DataFrame(rows)
+    st.caption(f"Showing top 50 of {n_filtered} apps — click app name to view details")
 
     # Two columns side-by-side
     col1, col2 = st.columns(2)
 
     with col1:
         st.subheader("Top Downloads")
-        by_downloads = sorted(filtered, key=lambda x: (x.get(dl_field) or 0), reverse=True)
-        df_dl = build_ranking_df(by_downloads)
-
         dl_event = st.dataframe(
             df_dl,
             use_container_width=True,
@@ -88,14 +112,11 @@ def render():
 
         if dl_event and dl_event.selection and dl_event.selection.rows:
             row_idx = dl_event.selection.rows[0]
-            st.session_state.selected_app_id = by_downloads[row_idx]["app_id"]
+            st.session_state.selected_app_id = ids_dl[row_idx]
             st.rerun()
 
     with col2:
         st.subheader("Top Grossing")
-        by_revenue = sorted(filtered, key=lambda x: (x.get(rev_field) or 0), reverse=True)
-        df_rev = build_ranking_df(by_revenue)
-
         rev_event = st.dataframe(
             df_rev,
             use_container_width=True,
@@ -108,5 +129,5 @@ def render():
 
         if rev_event and rev_event.selection and rev_event.selection.rows:
             row_idx = rev_event.selection.rows[0]
-            st.session_state.selected_app_id = by_revenue[row_idx]["app_id"]
+            st.session_state.selected_app_id = ids_rev[row_idx]
             st.rerun()
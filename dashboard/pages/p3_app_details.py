@@ -1,9 +1,93 @@
 """App Details page — drill-down view for individual apps."""
+import string
 import streamlit as st
-from datetime import datetime
 from components.data_loader import load_app_details
 from components.formatters import fmt_money, fmt_number, fmt_rating
 
+# HTML card templates, parsed once at import instead of per-rerun f-strings
+_RATING_CARD = string.Template("""
+    <div style="text-align: center; padding: 1.5rem; background: #1A1D23; border-radius: 12px;">
+        <div style="font-size: 3.5rem; font-weight: 700; color: #FFD700; margin-bottom: 0.5rem;">
+            $rating
+        </div>
+        <div style="font-size: 1.2rem; color: #888;">
+            $stars
+        </div>
+        <div style="margin-top: 0.5rem; color: #888; font-size: 0.9rem;">
+            Average Rating
+        </div>
+    </div>
+""")
+
+_COUNTS_CARD = string.Template("""
+    <div style="text-align: center; padding: 1.5rem; background: #1A1D23; border-radius: 12px;">
+        <div style="font-size: 2rem; font-weight: 700; color: #4CAF50; margin-bottom: 0.5rem;">
+            $global_count
+        </div>
+        <div style="color: #888; font-size: 0.9rem; margin-bottom: 0.8rem;">
+            Global Ratings
+        </div>
+        <div style="font-size: 1.3rem; font-weight: 600; color: #2196F3;">
+            $us_count
+        </div>
+        <div style="color: #888; font-size: 0.9rem;">
+            US Ratings
+        </div>
+    </div>
+""")
+
+_DISTRIBUTION_CARD = """
+    <div style="padding: 1.5rem; background: #1A1D23; border-radius: 12px;">
+        <div style="color: #888; font-size: 0.9rem; margin-bottom: 1rem;">
+            <strong>📊 Rating Distribution</strong>
+        </div>
+        <div style="color: #666; font-style: italic; padding: 1.5rem; text-align: center;">
+            Rating breakdown not available<br/>
+            <span style="font-size: 0.8rem;">(Requires SensorTower Premium tier)</span>
+        </div>
+    </div>
+"""
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _app_view_data(app_id):
+    """Pre-derive everything render() needs for one app.
+
+    Keyed by app_id so reruns triggered by unrelated widgets skip the
+    string assembly below.
+    """
+    app = load_app_details().get(str(app_id), {})
+    if not app:
+        return None
+
+    app_age = app.get("_app_age_years")
+
+    info = {
+        "Bundle ID": app.get("bundle_id", "N/A"),
+        "Version": app.get("version", "N/A"),
+        "Content Rating": app.get("content_rating", "N/A"),
+        "Release Date": (app.get("release_date", "")[:10] or "N/A"),
+        "Last Updated": (app.get("updated_date", "")[:10] or "N/A"),
+        "Platform": app.get("os", "ios").upper(),
+    }
+
+    langs = app.get("supported_languages", [])
+    langs_str = ""
+    if langs:
+        langs_str = ", ".join(langs[:10]) + (" + more" if len(langs) > 10 else "")
+
+    countries = app.get("top_countries", [])
+    countries_str = ", ".join(countries[:10]) if countries else ""
+
+    return {
+        "app": app,
+        "app_age": app_age,
+        "cats_joined": ", ".join(app.get("category_names", [])),
+        "info": info,
+        "langs_str": langs_str,
+        "countries_str": countries_str,
+    }
+
 
 def render():
     st.title("App Details")
@@ -21,13 +105,15 @@ def render():
     # Store as last viewed
     st.session_state.last_viewed_app_id = app_id
 
-    app_details = load_app_details()
-    app = app_details.get(str(app_id), {})
+    view = _app_view_data(app_id)
 
-    if not app:
+    if view is None:
         st.warning("App details not found.")
         return
 
+    app = view["app"]
+    app_age = view["app_age"]
+
     # ---- App Header ----
     col1, col2 = st.columns([1, 4])
     with col1:
@@ -38,22 +124,11 @@ def render():
         st.caption(f"by **{app['publisher_name']}**")
         if app.get("subtitle"):
             st.markdown(f"*{app['subtitle']}*")
-        cats = ", ".join(app.get("category_names", []))
-        if cats:
-            st.caption(f"Categories: {cats}")
+        if view["cats_joined"]:
+            st.caption(f"Categories: {view['cats_joined']}")
 
     st.divider()
 
-    # ---- Compute App Age ----
-    app_age = None
-    release_str = app.get("release_date", "")
-    if release_str:
-        try:
-            release_dt = datetime.fromisoformat(release_str.replace("Z", "+00:00"))
-            app_age = round((datetime.now(release_dt.tzinfo) - release_dt).days / 365.25, 1)
-        except (ValueError, TypeError):
-            pass
-
     # ---- Key Metrics ----
     m1, m2, m3, m4, m5 = st.columns(5)
     m1.metric("Est. Revenue", fmt_money(app.get("revenue", 0)))
@@ -71,60 +146,24 @@ def render():
     with r1:
         rating = app.get("rating", 0)
         st.markdown(
-            f"""
-            <div style="text-align: center; padding: 1.5rem; background: #1A1D23; border-radius: 12px;">
-                <div style="font-size: 3.5rem; font-weight: 700; color: #FFD700; margin-bottom: 0.5rem;">
-                    {fmt_rating(rating)}
-                </div>
-                <div style="font-size: 1.2rem; color: #888;">
-                    {'⭐' * int(round(rating))}
-                </div>
-                <div style="margin-top: 0.5rem; color: #888; font-size: 0.9rem;">
-                    Average Rating
-                </div>
-            </div>
-            """,
+            _RATING_CARD.substitute(
+                rating=fmt_rating(rating),
+                stars="⭐" * int(round(rating)),
+            ),
             unsafe_allow_html=True
         )
 
     with r2:
-        global_count = app.get("global_rating_count", 0)
-        us_count = app.get("rating_count", 0)
         st.markdown(
-            f"""
-            <div style="text-align: center; padding: 1.5rem; background: #1A1D23; border-radius: 12px;">
-                <div style="font-size: 2rem; font-weight: 700; color: #4CAF50; margin-bottom: 0.5rem;">
-                    {fmt_number(global_count)}
-                </div>
-                <div style="color: #888; font-size: 0.9rem; margin-bottom: 0.8rem;">
-                    Global Ratings
-                </div>
-                <div style="font-size: 1.3rem; font-weight: 600; color: #2196F3;">
-                    {fmt_number(us_count)}
-                </div>
-                <div style="color: #888; font-size: 0.9rem;">
-                    US Ratings
-                </div>
-            </div>
-            """,
+            _COUNTS_CARD.substitute(
+                global_count=fmt_number(app.get("global_rating_count", 0)),
+                us_count=fmt_number(app.get("rating_count", 0)),
+            ),
             unsafe_allow_html=True
         )
 
     with r3:
-        st.markdown(
-            """
-            <div style="padding: 1.5rem; background: #1A1D23; border-radius: 12px;">
-                <div style="color: #888; font-size: 0.9rem; margin-bottom: 1rem;">
-                    <strong>📊 Rating Distribution</strong>
-                </div>
-                <div style="color: #666; font-style: italic; padding: 1.5rem; text-align: center;">
-                    Rating breakdown not available<br/>
-                    <span style="font-size: 0.8rem;">(Requires SensorTower Premium tier)</span>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+        st.markdown(_DISTRIBUTION_CARD, unsafe_allow_html=True)
 
     st.divider()
 
@@ -134,27 +173,14 @@ def render():
     with col_a:
         st.subheader("App Information")
 
-        info = {
-            "Bundle ID": app.get("bundle_id", "N/A"),
-            "Version": app.get("version", "N/A"),
-            "Content Rating": app.get("content_rating", "N/A"),
-            "Release Date": (app.get("release_date", "")[:10] or "N/A"),
-            "Last Updated": (app.get("updated_date", "")[:10] or "N/A"),
-            "Platform": app.get("os", "ios").upper(),
-        }
-
-        for k, v in info.items():
+        for k, v in view["info"].items():
             st.markdown(f"**{k}:** {v}")
 
-        # Languages
-        langs = app.get("supported_languages", [])
-        if langs:
-            st.markdown(f"**Languages:** {', '.join(langs[:10])}" + (" + more" if len(langs) > 10 else ""))
+        if view["langs_str"]:
+            st.markdown(f"**Languages:** {view['langs_str']}")
 
-        # Top countries
-        countries = app.get("top_countries", [])
-        if countries:
-            st.markdown(f"**Top Countries:** {', '.join(countries[:10])}")
+        if view["countries_str"]:
+            st.markdown(f"**Top Countries:** {view['countries_str']}")
 
     with col_b:
         st.subheader("Description")
@@ -169,11 +195,12 @@ def render():
     screenshots = app.get("screenshot_urls", [])
     if screenshots:
         st.divider()
-        st.subheader("Screenshots")
-        cols = st.columns(min(len(screenshots), 5))
-        for i, url in enumerate(screenshots[:5]):
-            with cols[i]:
-                st.image(url, use_container_width=True)
+        # Collapsed by default so the image fetches only fire on demand
+        with st.expander(f"Screenshots ({min(len(screenshots), 5)})", expanded=False):
+            cols = st.columns(min(len(screenshots), 5))
+            for i, url in enumerate(screenshots[:5]):
+                with cols[i]:
+                    st.image(url, use_container_width=True)
 
     # ---- App Store Link ----
     if app.get("url"):
@@ -4,6 +4,8 @@ Explore SensorTower Facets API (the one shown in the screenshot).
 import os
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter, Retry
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,33 +15,46 @@ BASE_URL = "https://api.sensortower.com/v1"
 
 TEST_APP_IOS = "553834731"  # Candy Crush
 
-headers = {
+# Probe responses are only written to disk when explicitly requested;
+# default keeps exploration iteration free of file I/O
+SAVE_PROBES = os.getenv("SAVE_PROBES", "0") == "1"
+
+# One pooled connection for all probes — skips per-call TCP+TLS handshakes
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8, pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+SESSION.headers.update({
     "Authorization": f"Bearer {API_TOKEN}",
     "Accept": "application/json"
-}
+})
+
+FACETS_URL = f"{BASE_URL}/facets/metrics"
 
 def test_facet(params):
-    """Test facets/metrics endpoint."""
-    url = f"{BASE_URL}/facets/metrics"
+    """Probe the facets/metrics endpoint; returns printable report lines."""
+    lines = []
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=10)
-        print(f"\nStatus: {response.status_code}")
-        print(f"Params: {params}")
+        response = SESSION.get(FACETS_URL, params=params, timeout=10)
+        lines.append(f"\nStatus: {response.status_code}")
+        lines.append(f"Params: {params}")
 
         if response.status_code == 200:
             data = response.json()
-            filename = f"facet_test_{params.get('bundle', 'unknown')}.json"
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
-            print(f"✓ Success! Saved to: {filename}")
-            print(f"  Keys: {list(data.keys())}")
-            return data
+            if SAVE_PROBES:
+                filename = f"facet_test_{params.get('bundle', 'unknown')}.json"
+                with open(filename, 'w') as f:
+                    json.dump(data, f, indent=2)
+                lines.append(f"✓ Success! Saved to: {filename}")
+            else:
+                lines.append("✓ Success!")
+            lines.append(f"  Keys: {list(data.keys())}")
         else:
-            print(f"✗ Error: {response.text[:300]}")
-            return None
+            lines.append(f"✗ Error: {response.text[:300]}")
     except Exception as e:
-        print(f"✗ Exception: {e}")
-        return None
+        lines.append(f"✗ Exception: {e}")
+    return lines
 
 print("Testing Facets API")
 print("="*80)
@@ -58,15 +73,18 @@ bundles = [
     "ratings"
 ]
 
-for bundle in bundles:
-    print(f"\n### Bundle: {bundle}")
-    test_facet({
-        "bundle": bundle,
+# Bundles probe independently; fetch in parallel, print in order
+with ThreadPoolExecutor(max_workers=8) as pool:
+    reports = pool.map(lambda b: test_facet({
+        "bundle": b,
         "app_ids": TEST_APP_IOS,
         "start_date": "2025-01-01",
         "end_date": "2025-01-31",
         "regions": "US"
-    })
+    }), bundles)
+    for bundle, lines in zip(bundles, reports):
+        print(f"\n### Bundle: {bundle}")
+        print("\n".join(lines))
 
 print("\n" + "="*80)
 print("Exploration complete!")
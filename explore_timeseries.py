@@ -4,6 +4,8 @@ Explore SensorTower /v1/apps/timeseries endpoint.
 import os
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter, Retry
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,36 +15,49 @@ BASE_URL = "https://api.sensortower.com/v1"
 
 TEST_APP_IOS = "553834731"  # Candy Crush iOS
 
-headers = {
+# Probe responses are only written to disk when explicitly requested;
+# default keeps exploration iteration free of file I/O
+SAVE_PROBES = os.getenv("SAVE_PROBES", "0") == "1"
+
+# One pooled connection for all probes — skips per-call TCP+TLS handshakes
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8, pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+SESSION.headers.update({
     "Authorization": f"Bearer {API_TOKEN}",
     "Accept": "application/json"
-}
+})
+
+TIMESERIES_URL = f"{BASE_URL}/apps/timeseries"
 
 def test_timeseries(params):
-    """Test timeseries endpoint."""
-    url = f"{BASE_URL}/apps/timeseries"
+    """Probe the timeseries endpoint; returns printable report lines."""
+    lines = []
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=15)
-        print(f"\nStatus: {response.status_code}")
-        print(f"Params: {json.dumps(params, indent=2)}")
+        response = SESSION.get(TIMESERIES_URL, params=params, timeout=15)
+        lines.append(f"\nStatus: {response.status_code}")
+        lines.append(f"Params: {json.dumps(params, indent=2)}")
 
         if response.status_code == 200:
             data = response.json()
-            metric = params.get('timeseries', 'unknown').split(',')[0]
-            filename = f"timeseries_{metric}.json"
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
-            print(f"✓ Success! Saved to: {filename}")
-            print(f"  Keys: {list(data.keys())[:5]}")
+            if SAVE_PROBES:
+                metric = params.get('timeseries', 'unknown').split(',')[0]
+                filename = f"timeseries_{metric}.json"
+                with open(filename, 'w') as f:
+                    json.dump(data, f, indent=2)
+                lines.append(f"✓ Success! Saved to: {filename}")
+            else:
+                lines.append("✓ Success!")
+            lines.append(f"  Keys: {list(data.keys())[:5]}")
             if isinstance(data, list) and len(data) > 0:
-                print(f"  First item keys: {list(data[0].keys())}")
-            return data
+                lines.append(f"  First item keys: {list(data[0].keys())}")
         else:
-            print(f"✗ Error {response.status_code}: {response.text[:400]}")
-            return None
+            lines.append(f"✗ Error {response.status_code}: {response.text[:400]}")
     except Exception as e:
-        print(f"✗ Exception: {e}")
-        return None
+        lines.append(f"✗ Exception: {e}")
+    return lines
 
 print("Testing /v1/apps/timeseries API")
 print("="*80)
@@ -74,11 +89,16 @@ timeseries_options = [
     "downloads,revenue,rating",
 ]
 
-for ts in timeseries_options:
-    print(f"\n{'='*80}")
-    print(f"### Timeseries: {ts}")
-    params = {**base_params, "timeseries": ts}
-    test_timeseries(params)
+# Metrics probe independently; fetch in parallel, print in order
+with ThreadPoolExecutor(max_workers=8) as pool:
+    reports = pool.map(
+        lambda ts: test_timeseries({**base_params, "timeseries": ts}),
+        timeseries_options,
+    )
+    for ts, lines in zip(timeseries_options, reports):
+        print(f"\n{'='*80}")
+        print(f"### Timeseries: {ts}")
+        print("\n".join(lines))
 
 print("\n" + "="*80)
 print("Exploration complete!")
@@ -5,32 +5,33 @@ Run via GitHub Actions or manually: python scripts/data_refresh.py
 Fetches fresh data from SensorTower API, updates dashboard_data/.
 Cost: ~100 API calls per run (23 categories × 2 chart types × 2 calls + sales estimates).
 """
+import os
+import shutil
 import sys
-import json
+import orjson
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
 from api.sensortower_client import SensorTowerClient, CHART_TOP_FREE, CHART_TOP_GROSSING
 
-# Reuse the dashboard data generation logic
+# Reuse the dashboard data generation logic; imported lazily inside
+# refresh_data() so --dry-run and importers skip loading the whole builder
 sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
-from generate_dashboard_data import (
-    CATEGORIES,
-    DATA_DIR,
-    build_rankings,
-    build_app_details,
-    build_all_apps_table,
-    build_category_summary,
-    build_publisher_summary,
-    build_daily_snapshot,
-    build_trends,
-    get_revenue,
-    get_downloads,
-)
+
+
+def _write_json(path, obj, default=None):
+    """Write compact JSON bytes with orjson; much faster than pretty stdlib dumps.
+
+    OPT_NON_STR_KEYS matches stdlib json.dump, which coerced the integer
+    app-ID keys in app_details; orjson rejects them by default.
+    """
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=default))
 
 
 def fetch_sales_estimates(client, app_ids_list):
@@ -74,27 +75,43 @@ def fetch_sales_estimates(client, app_ids_list):
                     end_date=end_str,
                     use_cache=True,  # Cache sales estimates
                 )
+                if isinstance(data, dict):
+                    # Some responses wrap in a dict
+                    data = data.get("data", data.get("estimates", []))
                 if isinstance(data, list):
                     for record in data:
                         aid = record.get("aid")
                         if aid:
-                            results[aid][dl_key] += record.get("iu", 0) or 0
-                            results[aid][rev_key] += int((record.get("ir", 0) or 0) / 100)
-                elif isinstance(data, dict):
-                    # Some responses wrap in a dict
-                    for record in data.get("data", data.get("estimates", [])):
-                        aid = record.get("aid")
-                        if aid:
-                            results[aid][dl_key] += record.get("iu", 0) or 0
-                            results[aid][rev_key] += int((record.get("ir", 0) or 0) / 100)
+                            # single dict lookup per field; floor-div keeps
+                            # the cents conversion in integer arithmetic
+                            rec = results[aid]
+                            rec[dl_key] += record.get("iu") or 0
+                            rec[rev_key] += (record.get("ir") or 0) // 100
             except Exception as e:
                 print(f"    WARNING: Sales estimates failed for {period_key} batch {batch_idx + 1}: {e}")
 
     return dict(results)
 
 
-def refresh_data():
-    """Fetch fresh data from API and rebuild dashboard data."""
+def refresh_data(max_workers=8, force_refresh=False):
+    """Fetch fresh data from API and rebuild dashboard data.
+
+    Chart fetches go through the client's disk cache by default: the cache
+    key includes the ranking date, so a new day always misses while same-day
+    re-runs (e.g. CI retries) cost zero API calls. Pass force_refresh=True
+    to bypass the cache entirely.
+    """
+    from generate_dashboard_data import (
+        CATEGORIES,
+        DATA_DIR,
+        build_all,
+        build_all_apps_table,
+        build_publisher_summary,
+        build_daily_snapshot,
+        append_trend,
+        _record_snapshot,
+    )
+
     client = SensorTowerClient(cache_ttl_hours=12)  # Short TTL for refresh
 
     usage_before = client.get_monthly_usage()
@@ -108,51 +125,49 @@ def refresh_data():
     ranking_date = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
     print(f"Using ranking date: {ranking_date}")
 
-    # Collect data in the same format as the initial collection scripts
+    # Collect data in the same format as the initial collection scripts.
+    # The ~46 chart fetches are independent network round trips, so run
+    # them on a small thread pool instead of serially.
     free_data = {}
     grossing_data = {}
 
-    for cat_id, cat_name in CATEGORIES.items():
-        print(f"\nRefreshing {cat_name}...")
-
-        # Top Free
-        result = client.get_top_apps(
-            category=cat_id,
-            chart_type=CHART_TOP_FREE,
-            country="US",
-            date=ranking_date,
-            limit=50,
-            resolve_details=True,
-            use_cache=False,  # Force fresh data
-        )
-        free_data[cat_name] = {
-            "category_id": cat_id,
-            "top_free": result,
-        }
-        print(f"  Top Free: {len(result.get('apps', []))} apps")
-
-        # Top Grossing
-        result = client.get_top_apps(
+    def fetch_chart(cat_id, chart_type):
+        return client.get_top_apps(
             category=cat_id,
-            chart_type=CHART_TOP_GROSSING,
+            chart_type=chart_type,
             country="US",
             date=ranking_date,
             limit=50,
             resolve_details=True,
-            use_cache=False,
+            use_cache=not force_refresh,
         )
-        grossing_data[cat_name] = {
-            "category_id": cat_id,
-            "top_grossing": result,
-        }
-        print(f"  Top Grossing: {len(result.get('apps', []))} apps")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {}
+        for cat_id, cat_name in CATEGORIES.items():
+            futures[pool.submit(fetch_chart, cat_id, CHART_TOP_FREE)] = (cat_id, cat_name, "free")
+            futures[pool.submit(fetch_chart, cat_id, CHART_TOP_GROSSING)] = (cat_id, cat_name, "grossing")
+
+        for future in as_completed(futures):
+            cat_id, cat_name, kind = futures[future]
+            result = future.result()
+            if kind == "free":
+                free_data[cat_name] = {
+                    "category_id": cat_id,
+                    "top_free": result,
+                }
+                print(f"  {cat_name} Top Free: {len(result.get('apps', []))} apps")
+            else:
+                grossing_data[cat_name] = {
+                    "category_id": cat_id,
+                    "top_grossing": result,
+                }
+                print(f"  {cat_name} Top Grossing: {len(result.get('apps', []))} apps")
 
     # Rebuild dashboard data
     print("\nRebuilding dashboard data...")
 
-    rankings = build_rankings(free_data, grossing_data)
-    app_details = build_app_details(free_data, grossing_data)
-    cat_summary = build_category_summary(rankings, app_details)
+    rankings, app_details, cat_summary = build_all(free_data, grossing_data)
     pub_summary = build_publisher_summary(app_details, rankings)
 
     # Collect all unique app_ids for sales estimates
@@ -161,38 +176,47 @@ def refresh_data():
     sales_estimates = fetch_sales_estimates(client, all_app_ids)
     print(f"  Got estimates for {len(sales_estimates)} apps")
 
-    # Save current
-    current_dir = DATA_DIR / "current"
-    current_dir.mkdir(parents=True, exist_ok=True)
-
-    with open(current_dir / "rankings.json", "w") as f:
-        json.dump(rankings, f, indent=2)
-
-    with open(current_dir / "app_details.json", "w") as f:
-        json.dump(app_details, f, indent=2, default=str)
-
-    with open(current_dir / "category_summary.json", "w") as f:
-        json.dump(cat_summary, f, indent=2)
+    all_apps_table = build_all_apps_table(rankings, app_details, sales_estimates)
 
-    with open(current_dir / "publisher_summary.json", "w") as f:
-        json.dump(pub_summary, f, indent=2)
+    # Save current: write everything into a scratch directory, then swap it
+    # into place so dashboard readers never see a half-written state.
+    current_dir = DATA_DIR / "current"
+    tmp_dir = DATA_DIR / f"current.tmp-{os.getpid()}"
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+
+    current_files = {
+        "rankings.json": rankings,
+        "app_details.json": app_details,
+        "category_summary.json": cat_summary,
+        "publisher_summary.json": pub_summary,
+        "all_apps_table.json": all_apps_table,
+    }
+    # Disk-bound writes overlap fine on a small pool
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda kv: _write_json(tmp_dir / kv[0], kv[1]), current_files.items()))
 
-    all_apps_table = build_all_apps_table(rankings, app_details, sales_estimates)
-    with open(current_dir / "all_apps_table.json", "w") as f:
-        json.dump(all_apps_table, f, indent=2, default=str)
+    old_dir = DATA_DIR / f"current.old-{os.getpid()}"
+    if current_dir.exists():
+        os.rename(current_dir, old_dir)
+    os.rename(tmp_dir, current_dir)
+    if old_dir.exists():
+        shutil.rmtree(old_dir)
 
     # Save daily snapshot
     snapshots_dir = DATA_DIR / "historical" / "snapshots"
     snapshots_dir.mkdir(parents=True, exist_ok=True)
 
     snapshot = build_daily_snapshot(rankings, today)
-    with open(snapshots_dir / f"{today}.json", "w") as f:
-        json.dump(snapshot, f, indent=2)
+    _write_json(snapshots_dir / f"{today}.json", snapshot)
+    _record_snapshot(snapshots_dir, today)
 
-    # Rebuild trends
-    trends = build_trends(snapshots_dir)
-    with open(DATA_DIR / "historical" / "trends.json", "w") as f:
-        json.dump(trends, f, indent=2)
+    # Update trends incrementally — append today's point instead of
+    # re-reading every historical snapshot on each refresh
+    trends_path = DATA_DIR / "historical" / "trends.json"
+    trends = append_trend(trends_path, snapshot, snapshots_dir)
+    _write_json(trends_path, trends)
 
     # Update metadata
     usage_after = client.get_monthly_usage()
@@ -206,18 +230,14 @@ def refresh_data():
         "api_calls_this_refresh": usage_after - usage_before,
         "api_usage_monthly": usage_after,
     }
-    with open(DATA_DIR / "metadata.json", "w") as f:
-        json.dump(metadata, f, indent=2)
+    _write_json(DATA_DIR / "metadata.json", metadata)
 
     # Also save raw processed data for backup
     processed_dir = PROJECT_ROOT / "data" / "processed"
     processed_dir.mkdir(parents=True, exist_ok=True)
 
-    with open(processed_dir / f"initial_collection_{today.replace('-', '')}.json", "w") as f:
-        json.dump(free_data, f, indent=2, default=str)
-
-    with open(processed_dir / f"top_grossing_{today.replace('-', '')}.json", "w") as f:
-        json.dump(grossing_data, f, indent=2, default=str)
+    _write_json(processed_dir / f"initial_collection_{today.replace('-', '')}.json", free_data)
+    _write_json(processed_dir / f"top_grossing_{today.replace('-', '')}.json", grossing_data)
 
     print(f"\nRefresh complete!")
     print(f"  Apps: {len(app_details)}")
@@ -235,6 +255,17 @@ if __name__ == "__main__":
         action="store_true",
         help="Validate environment and API connectivity without making bulk API calls or writing files",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=8,
+        help="Concurrent chart fetches; lower this if the API starts rate-limiting",
+    )
+    parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Bypass the API disk cache and refetch every chart",
+    )
     args = parser.parse_args()
 
     if args.dry_run:
@@ -248,7 +279,7 @@ if __name__ == "__main__":
         sys.exit(0)
 
     try:
-        refresh_data()
+        refresh_data(max_workers=args.max_workers, force_refresh=args.force_refresh)
     except KeyboardInterrupt:
         print("\nRefresh interrupted.")
         sys.exit(1)
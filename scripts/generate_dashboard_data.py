@@ -4,9 +4,12 @@ Also used as a library by data_refresh.py for recomputation.
 """
 import json
 import sys
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from collections import Counter, defaultdict
+from functools import lru_cache
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
@@ -51,20 +54,36 @@ ALL_IOS_CATEGORIES = {
     6023: "Food & Drink", 6024: "Shopping",
 }
 CATEGORY_ID_TO_NAME = ALL_IOS_CATEGORIES
+CATEGORY_NAME_TO_ID = {v: k for k, v in CATEGORIES.items()}
+
+
+def _dump_json(path, obj, default=None):
+    """Serialize with orjson in a single write; keeps indent for readable diffs.
+
+    OPT_NON_STR_KEYS matches stdlib json.dump, which coerced the integer
+    app-ID keys in app_details; orjson rejects them by default.
+    """
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=default,
+        ))
+
+
+# Hoisted once; these accessors run for every ranked row and app record
+_REVENUE_KEY = "humanized_worldwide_last_month_revenue"
+_DOWNLOADS_KEY = "humanized_worldwide_last_month_downloads"
 
 
 def get_revenue(app):
-    r = app.get("humanized_worldwide_last_month_revenue")
-    if isinstance(r, dict):
-        return r.get("revenue", 0) or 0
-    return 0
+    r = app.get(_REVENUE_KEY)
+    return (r.get("revenue") or 0) if r else 0
 
 
 def get_downloads(app):
-    d = app.get("humanized_worldwide_last_month_downloads")
-    if isinstance(d, dict):
-        return d.get("downloads", 0) or 0
-    return 0
+    d = app.get(_DOWNLOADS_KEY)
+    return (d.get("downloads") or 0) if d else 0
 
 
 def load_existing_data():
@@ -85,6 +104,28 @@ def load_existing_data():
     return free_data, grossing_data
 
 
+def _ranked_rows(src, limit=50):
+    """Yield ranked rows for one chart feed; shared by both chart types."""
+    # Local bindings keep the tight loop off the global lookup path
+    _revenue = get_revenue
+    _downloads = get_downloads
+    apps_by_id = {a["app_id"]: a for a in src.get("apps", [])}
+    for rank, aid in enumerate(src.get("ranking", [])[:limit], 1):
+        app = apps_by_id.get(aid, {})
+        yield {
+            "rank": rank,
+            "app_id": aid,
+            "name": app.get("name", "Unknown"),
+            "publisher_name": app.get("publisher_name", "Unknown"),
+            "icon_url": app.get("icon_url", ""),
+            "rating": app.get("rating", 0),
+            "revenue": _revenue(app),
+            "downloads": _downloads(app),
+            "has_iap": bool(app.get("in_app_purchases")),
+            "price": app.get("price", 0),
+        }
+
+
 def build_rankings(free_data, grossing_data):
     """Build rankings.json: category → chart_type → ranked list with basic info."""
     rankings = {}
@@ -94,57 +135,62 @@ def build_rankings(free_data, grossing_data):
 
         if cat_name in free_data and "top_free" in free_data[cat_name]:
             src = free_data[cat_name]["top_free"]
-            ranked = []
-            app_ids = src.get("ranking", [])
-            apps_by_id = {a["app_id"]: a for a in src.get("apps", [])}
-            for rank, aid in enumerate(app_ids[:50], 1):
-                app = apps_by_id.get(aid, {})
-                ranked.append({
-                    "rank": rank,
-                    "app_id": aid,
-                    "name": app.get("name", "Unknown"),
-                    "publisher_name": app.get("publisher_name", "Unknown"),
-                    "icon_url": app.get("icon_url", ""),
-                    "rating": app.get("rating", 0),
-                    "revenue": get_revenue(app),
-                    "downloads": get_downloads(app),
-                    "has_iap": bool(app.get("in_app_purchases")),
-                    "price": app.get("price", 0),
-                })
             rankings[cat_name]["topfreeapplications"] = {
                 "date": src.get("date", ""),
                 "country": src.get("country", "US"),
-                "apps": ranked,
+                "apps": list(_ranked_rows(src)),
             }
 
         if cat_name in grossing_data and "top_grossing" in grossing_data[cat_name]:
             src = grossing_data[cat_name]["top_grossing"]
-            ranked = []
-            app_ids = src.get("ranking", [])
-            apps_by_id = {a["app_id"]: a for a in src.get("apps", [])}
-            for rank, aid in enumerate(app_ids[:50], 1):
-                app = apps_by_id.get(aid, {})
-                ranked.append({
-                    "rank": rank,
-                    "app_id": aid,
-                    "name": app.get("name", "Unknown"),
-                    "publisher_name": app.get("publisher_name", "Unknown"),
-                    "icon_url": app.get("icon_url", ""),
-                    "rating": app.get("rating", 0),
-                    "revenue": get_revenue(app),
-                    "downloads": get_downloads(app),
-                    "has_iap": bool(app.get("in_app_purchases")),
-                    "price": app.get("price", 0),
-                })
             rankings[cat_name]["topgrossingapplications"] = {
                 "date": src.get("date", ""),
                 "country": src.get("country", "US"),
-                "apps": ranked,
+                "apps": list(_ranked_rows(src)),
             }
 
     return rankings
 
 
+def _app_detail_record(app):
+    """Extract the fields we care about for the dashboard from one raw app."""
+    return {
+        "app_id": app["app_id"],
+        "name": app.get("name", ""),
+        "publisher_name": app.get("publisher_name", ""),
+        "publisher_id": app.get("publisher_id"),
+        "icon_url": app.get("icon_url", ""),
+        "url": app.get("url", ""),
+        "os": app.get("os", "ios"),
+        "categories": app.get("categories", []),
+        "category_names": [
+            CATEGORY_ID_TO_NAME.get(c, f"Cat {c}")
+            for c in app.get("categories", [])
+        ],
+        "rating": app.get("rating", 0),
+        "global_rating_count": app.get("global_rating_count", 0),
+        "rating_count": app.get("rating_count", 0),
+        "price": app.get("price", 0),
+        "in_app_purchases": bool(app.get("in_app_purchases")),
+        "revenue": get_revenue(app),
+        "downloads": get_downloads(app),
+        "revenue_string": (app.get("humanized_worldwide_last_month_revenue") or {}).get("string", "N/A"),
+        "downloads_string": (app.get("humanized_worldwide_last_month_downloads") or {}).get("string", "N/A"),
+        # Coerced to str here so serializers never need a default= fallback
+        "release_date": str(app.get("release_date") or ""),
+        "updated_date": str(app.get("updated_date") or ""),
+        "version": app.get("version", ""),
+        "content_rating": app.get("content_rating", ""),
+        "subtitle": app.get("subtitle", ""),
+        "description": (app.get("description", "") or "")[:500],
+        "screenshot_urls": (app.get("screenshot_urls") or [])[:5],
+        "top_countries": app.get("top_countries", []),
+        "supported_languages": app.get("supported_languages", []),
+        "bundle_id": app.get("bundle_id", ""),
+        "app_age_years": _compute_app_age(app.get("release_date", "")),
+    }
+
+
 def build_app_details(free_data, grossing_data):
     """Build app_details.json: deduplicated full app records."""
     apps = {}
@@ -157,41 +203,7 @@ def build_app_details(free_data, grossing_data):
             for app in chart_data.get("apps", []):
                 aid = app["app_id"]
                 if aid not in apps:
-                    # Extract the fields we care about for the dashboard
-                    apps[aid] = {
-                        "app_id": aid,
-                        "name": app.get("name", ""),
-                        "publisher_name": app.get("publisher_name", ""),
-                        "publisher_id": app.get("publisher_id"),
-                        "icon_url": app.get("icon_url", ""),
-                        "url": app.get("url", ""),
-                        "os": app.get("os", "ios"),
-                        "categories": app.get("categories", []),
-                        "category_names": [
-                            CATEGORY_ID_TO_NAME.get(c, f"Cat {c}")
-                            for c in app.get("categories", [])
-                        ],
-                        "rating": app.get("rating", 0),
-                        "global_rating_count": app.get("global_rating_count", 0),
-                        "rating_count": app.get("rating_count", 0),
-                        "price": app.get("price", 0),
-                        "in_app_purchases": bool(app.get("in_app_purchases")),
-                        "revenue": get_revenue(app),
-                        "downloads": get_downloads(app),
-                        "revenue_string": (app.get("humanized_worldwide_last_month_revenue") or {}).get("string", "N/A"),
-                        "downloads_string": (app.get("humanized_worldwide_last_month_downloads") or {}).get("string", "N/A"),
-                        "release_date": app.get("release_date", ""),
-                        "updated_date": app.get("updated_date", ""),
-                        "version": app.get("version", ""),
-                        "content_rating": app.get("content_rating", ""),
-                        "subtitle": app.get("subtitle", ""),
-                        "description": (app.get("description", "") or "")[:500],
-                        "screenshot_urls": (app.get("screenshot_urls") or [])[:5],
-                        "top_countries": app.get("top_countries", []),
-                        "supported_languages": app.get("supported_languages", []),
-                        "bundle_id": app.get("bundle_id", ""),
-                        "app_age_years": _compute_app_age(app.get("release_date", "")),
-                    }
+                    apps[aid] = _app_detail_record(app)
 
     return apps
 
@@ -220,6 +232,11 @@ def build_all_apps_table(rankings, app_details, sales_estimates=None):
     if sales_estimates is None:
         sales_estimates = {}
 
+    # Normalize both join sides to string keys once, so the hot loop does a
+    # single hash lookup per row instead of str/int fallback probing
+    details_by_id = {str(k): v for k, v in app_details.items()}
+    estimates_by_id = {str(k): v for k, v in sales_estimates.items()}
+
     seen = {}
 
     for cat_name, cat_data in rankings.items():
@@ -227,8 +244,8 @@ def build_all_apps_table(rankings, app_details, sales_estimates=None):
             chart_label = "Top Free" if "free" in chart_type else "Top Grossing"
             for app_entry in chart_data.get("apps", []):
                 aid = str(app_entry["app_id"])
-                detail = app_details.get(aid) or app_details.get(int(aid), {})
-                estimates = sales_estimates.get(int(aid), sales_estimates.get(aid, {}))
+                detail = details_by_id.get(aid, {})
+                estimates = estimates_by_id.get(aid, {})
 
                 if aid not in seen:
                     seen[aid] = {
@@ -288,13 +305,16 @@ def build_category_summary(rankings, app_details):
                     if app_entry.get("rating", 0) > 0:
                         ratings.append(app_entry["rating"])
 
-        # Top grossing specific metrics
+        # Top grossing specific metrics — one pass for both totals
         grossing_apps = cat_data.get("topgrossingapplications", {}).get("apps", [])
-        grossing_revenue = sum(a.get("revenue", 0) for a in grossing_apps)
-        grossing_downloads = sum(a.get("downloads", 0) for a in grossing_apps)
+        grossing_revenue = 0
+        grossing_downloads = 0
+        for a in grossing_apps:
+            grossing_revenue += a.get("revenue", 0)
+            grossing_downloads += a.get("downloads", 0)
 
         summary[cat_name] = {
-            "category_id": [k for k, v in CATEGORIES.items() if v == cat_name][0],
+            "category_id": CATEGORY_NAME_TO_ID[cat_name],
             "total_apps_tracked": len(all_app_ids),
             "total_revenue": total_revenue,
             "total_downloads": total_downloads,
@@ -309,6 +329,77 @@ def build_category_summary(rankings, app_details):
     return summary
 
 
+def build_all(free_data, grossing_data):
+    """Build rankings, app details and category summary in one fused pass.
+
+    The standalone builders each walk the same chart feeds; fusing them
+    emits all three outputs from a single loop so the ~200 app records are
+    touched once. Output matches build_rankings / build_app_details /
+    build_category_summary exactly.
+    """
+    rankings = {}
+    app_details = {}
+    summary = {}
+
+    for cat_name in CATEGORIES.values():
+        rankings[cat_name] = {}
+        seen_ids = set()
+        total_revenue = 0
+        total_downloads = 0
+        rating_sum = 0.0
+        rating_n = 0
+        grossing_revenue = 0
+        grossing_downloads = 0
+
+        for src_key, chart_type, src_data in (
+            ("top_free", "topfreeapplications", free_data),
+            ("top_grossing", "topgrossingapplications", grossing_data),
+        ):
+            if cat_name not in src_data or src_key not in src_data[cat_name]:
+                continue
+            src = src_data[cat_name][src_key]
+            ranked = list(_ranked_rows(src))
+            rankings[cat_name][chart_type] = {
+                "date": src.get("date", ""),
+                "country": src.get("country", "US"),
+                "apps": ranked,
+            }
+
+            is_grossing = chart_type == "topgrossingapplications"
+            for row in ranked:
+                aid = row["app_id"]
+                if aid not in seen_ids:
+                    seen_ids.add(aid)
+                    total_revenue += row["revenue"]
+                    total_downloads += row["downloads"]
+                    if row["rating"] > 0:
+                        rating_sum += row["rating"]
+                        rating_n += 1
+                if is_grossing:
+                    grossing_revenue += row["revenue"]
+                    grossing_downloads += row["downloads"]
+
+            for app in src.get("apps", []):
+                aid = app["app_id"]
+                if aid not in app_details:
+                    app_details[aid] = _app_detail_record(app)
+
+        summary[cat_name] = {
+            "category_id": CATEGORY_NAME_TO_ID[cat_name],
+            "total_apps_tracked": len(seen_ids),
+            "total_revenue": total_revenue,
+            "total_downloads": total_downloads,
+            "avg_rating": round(rating_sum / rating_n, 2) if rating_n else 0,
+            "grossing_revenue": grossing_revenue,
+            "grossing_downloads": grossing_downloads,
+            "revenue_per_download": round(grossing_revenue / grossing_downloads, 2) if grossing_downloads else 0,
+            "top_free_count": len(rankings[cat_name].get("topfreeapplications", {}).get("apps", [])),
+            "top_grossing_count": len(rankings[cat_name].get("topgrossingapplications", {}).get("apps", [])),
+        }
+
+    return rankings, app_details, summary
+
+
 def build_publisher_summary(app_details, rankings):
     """Build publisher_summary.json: aggregated KPIs per publisher."""
     publisher_apps = defaultdict(list)
@@ -327,14 +418,27 @@ def build_publisher_summary(app_details, rankings):
 
     summary = []
     for pub_name, apps in publisher_apps.items():
-        total_rev = sum(a.get("revenue", 0) for a in apps)
-        total_dl = sum(a.get("downloads", 0) for a in apps)
+        # One pass per publisher covers the totals, rating average, top
+        # app and category union that previously took five iterations
+        total_rev = 0
+        total_dl = 0
+        rating_sum = 0.0
+        rating_n = 0
+        top_rev = -1
+        top_app = apps[0]
         cats = set()
         for a in apps:
-            for cn in a.get("category_names", []):
-                cats.add(cn)
-
-        top_app = max(apps, key=lambda x: x.get("revenue", 0))
+            rev = a.get("revenue", 0)
+            total_rev += rev
+            total_dl += a.get("downloads", 0)
+            rating = a.get("rating", 0)
+            if rating > 0:
+                rating_sum += rating
+                rating_n += 1
+            if rev > top_rev:
+                top_rev = rev
+                top_app = a
+            cats.update(a.get("category_names", []))
 
         summary.append({
             "publisher_name": pub_name,
@@ -342,11 +446,7 @@ def build_publisher_summary(app_details, rankings):
             "chart_appearances": publisher_chart_count.get(pub_name, 0),
             "total_revenue": total_rev,
             "total_downloads": total_dl,
-            "avg_rating": round(
-                sum(a.get("rating", 0) for a in apps if a.get("rating", 0) > 0) /
-                max(sum(1 for a in apps if a.get("rating", 0) > 0), 1),
-                2
-            ),
+            "avg_rating": round(rating_sum / max(rating_n, 1), 2),
             "categories": sorted(cats),
             "top_app_name": top_app.get("name", ""),
             "top_app_revenue": top_app.get("revenue", 0),
@@ -356,6 +456,20 @@ def build_publisher_summary(app_details, rankings):
     return summary
 
 
+@lru_cache(maxsize=4096)
+def _snapshot_row(rank, app_id, name, revenue, downloads):
+    """Memoized snapshot row; chart composition is mostly stable day to day,
+    so repeat builds in one process reuse the dict instead of reallocating.
+    Rows are serialized immediately and never mutated."""
+    return {
+        "rank": rank,
+        "app_id": app_id,
+        "name": name,
+        "revenue": revenue,
+        "downloads": downloads,
+    }
+
+
 def build_daily_snapshot(rankings, date_str):
     """Build a compact daily snapshot for historical tracking."""
     snapshot = {
@@ -367,34 +481,55 @@ def build_daily_snapshot(rankings, date_str):
         snapshot["categories"][cat_name] = {}
         for chart_type, chart_data in cat_data.items():
             snapshot["categories"][cat_name][chart_type] = [
-                {
-                    "rank": a["rank"],
-                    "app_id": a["app_id"],
-                    "name": a["name"],
-                    "revenue": a.get("revenue", 0),
-                    "downloads": a.get("downloads", 0),
-                }
+                _snapshot_row(
+                    a["rank"], a["app_id"], a["name"],
+                    a.get("revenue", 0), a.get("downloads", 0),
+                )
                 for a in chart_data.get("apps", [])
             ]
 
     return snapshot
 
 
-def build_trends(snapshots_dir):
-    """Build trends.json from all historical snapshots."""
-    snapshots = []
-    for f in sorted(snapshots_dir.glob("*.json")):
-        with open(f) as fh:
-            snapshots.append(json.load(fh))
+def _record_snapshot(snapshots_dir, date_str):
+    """Append a snapshot date to the manifest build_trends reads.
 
-    if not snapshots:
-        return {"dates": [], "categories": {}}
+    The manifest keeps filenames in write order, so trend rebuilds skip
+    the directory scan and sort entirely.
+    """
+    manifest = snapshots_dir / "manifest.txt"
+    if manifest.exists():
+        existing = manifest.read_text().split()
+    else:
+        # First write: seed from snapshots that predate the manifest so
+        # history isn't silently dropped from later trend rebuilds
+        existing = sorted(p.stem for p in snapshots_dir.glob("*.json"))
+        if existing:
+            manifest.write_text("\n".join(existing) + "\n")
+    if date_str not in existing:
+        with open(manifest, "a") as f:
+            f.write(f"{date_str}\n")
+
+
+def _snapshot_files(snapshots_dir):
+    """Snapshot paths in chronological order, from the manifest when present."""
+    manifest = snapshots_dir / "manifest.txt"
+    if manifest.exists():
+        return [
+            p for p in (snapshots_dir / f"{d}.json" for d in manifest.read_text().split())
+            if p.exists()
+        ]
+    return sorted(snapshots_dir.glob("*.json"))
 
-    trends = {
-        "dates": [s["date"] for s in snapshots],
-        "categories": {},
-    }
 
+def build_trends(snapshots_dir):
+    """Build trends.json from all historical snapshots.
+
+    Snapshots are processed one file at a time; only the accumulated
+    per-category series stay resident, so peak memory is flat no matter
+    how long the history grows.
+    """
+    trends = {"dates": [], "categories": {}}
     for cat_name in CATEGORIES.values():
         trends["categories"][cat_name] = {
             "grossing_revenue": [],
@@ -402,22 +537,76 @@ def build_trends(snapshots_dir):
             "free_downloads": [],
         }
 
-        for s in snapshots:
-            cat_data = s.get("categories", {}).get(cat_name, {})
+    for f in _snapshot_files(snapshots_dir):
+        s = orjson.loads(f.read_bytes())
+        trends["dates"].append(s["date"])
+        categories = s.get("categories", {})
 
+        for cat_name, cat_trend in trends["categories"].items():
+            cat_data = categories.get(cat_name, {})
             grossing = cat_data.get("topgrossingapplications", [])
             free = cat_data.get("topfreeapplications", [])
 
-            trends["categories"][cat_name]["grossing_revenue"].append(
+            cat_trend["grossing_revenue"].append(
                 sum(a.get("revenue", 0) for a in grossing)
             )
-            trends["categories"][cat_name]["grossing_downloads"].append(
+            cat_trend["grossing_downloads"].append(
                 sum(a.get("downloads", 0) for a in grossing)
             )
-            trends["categories"][cat_name]["free_downloads"].append(
+            cat_trend["free_downloads"].append(
                 sum(a.get("downloads", 0) for a in free)
             )
 
+    if not trends["dates"]:
+        return {"dates": [], "categories": {}}
+
+    return trends
+
+
+def append_trend(trends_path, snapshot, snapshots_dir):
+    """Extend trends with one new snapshot instead of rebuilding from scratch.
+
+    Loads the existing trends.json once and appends today's per-category
+    aggregates in a single pass over the new snapshot. Falls back to a full
+    build_trends() when the file is missing, unreadable, or the snapshot's
+    date is already recorded (same-day re-run).
+    """
+    trends = None
+    if trends_path.exists():
+        try:
+            trends = orjson.loads(trends_path.read_bytes())
+        except ValueError:
+            trends = None
+
+    date_str = snapshot.get("date")
+    if not (trends and trends.get("dates")) or date_str in trends["dates"]:
+        return build_trends(snapshots_dir)
+
+    trends["dates"].append(date_str)
+    n_prior = len(trends["dates"]) - 1
+    snapshot_cats = snapshot.get("categories", {})
+
+    # Union of stored and snapshot categories: every series gets exactly
+    # one point per date, zero-filled like build_trends, whether a
+    # category vanished from today's snapshot or was newly added
+    for cat_name in trends["categories"].keys() | snapshot_cats.keys():
+        cat_trend = trends["categories"].setdefault(cat_name, {
+            "grossing_revenue": [],
+            "grossing_downloads": [],
+            "free_downloads": [],
+        })
+        # Backfill a newly tracked category so it aligns with prior dates
+        for series in cat_trend.values():
+            if len(series) < n_prior:
+                series.extend([0] * (n_prior - len(series)))
+
+        cat_data = snapshot_cats.get(cat_name, {})
+        grossing = cat_data.get("topgrossingapplications", [])
+        free = cat_data.get("topfreeapplications", [])
+        cat_trend["grossing_revenue"].append(sum(a.get("revenue", 0) for a in grossing))
+        cat_trend["grossing_downloads"].append(sum(a.get("downloads", 0) for a in grossing))
+        cat_trend["free_downloads"].append(sum(a.get("downloads", 0) for a in free))
+
     return trends
 
 
@@ -430,14 +619,8 @@ def generate_all():
         print("ERROR: No processed data found in data/processed/")
         return
 
-    print("Building rankings...")
-    rankings = build_rankings(free_data, grossing_data)
-
-    print("Building app details...")
-    app_details = build_app_details(free_data, grossing_data)
-
-    print("Building category summary...")
-    cat_summary = build_category_summary(rankings, app_details)
+    print("Building rankings, app details and category summary...")
+    rankings, app_details, cat_summary = build_all(free_data, grossing_data)
 
     print("Building publisher summary...")
     pub_summary = build_publisher_summary(app_details, rankings)
@@ -449,40 +632,34 @@ def generate_all():
     current_dir = DATA_DIR / "current"
     current_dir.mkdir(parents=True, exist_ok=True)
 
-    with open(current_dir / "rankings.json", "w") as f:
-        json.dump(rankings, f, indent=2)
-    print(f"  Wrote rankings.json ({len(rankings)} categories)")
+    today = datetime.now().strftime("%Y-%m-%d")
+    snapshots_dir = DATA_DIR / "historical" / "snapshots"
+    snapshots_dir.mkdir(parents=True, exist_ok=True)
+    snapshot = build_daily_snapshot(rankings, today)
 
-    with open(current_dir / "app_details.json", "w") as f:
-        json.dump(app_details, f, indent=2, default=str)
-    print(f"  Wrote app_details.json ({len(app_details)} apps)")
+    # Independent files: overlap the writes on a small pool
+    writes = [
+        (current_dir / "rankings.json", rankings, None),
+        (current_dir / "app_details.json", app_details, None),
+        (current_dir / "category_summary.json", cat_summary, None),
+        (current_dir / "publisher_summary.json", pub_summary, None),
+        (current_dir / "all_apps_table.json", all_apps_table, None),
+        (snapshots_dir / f"{today}.json", snapshot, None),
+    ]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda w: _dump_json(w[0], w[1], default=w[2]), writes))
+    _record_snapshot(snapshots_dir, today)
 
-    with open(current_dir / "category_summary.json", "w") as f:
-        json.dump(cat_summary, f, indent=2)
+    print(f"  Wrote rankings.json ({len(rankings)} categories)")
+    print(f"  Wrote app_details.json ({len(app_details)} apps)")
     print(f"  Wrote category_summary.json")
-
-    with open(current_dir / "publisher_summary.json", "w") as f:
-        json.dump(pub_summary, f, indent=2)
     print(f"  Wrote publisher_summary.json ({len(pub_summary)} publishers)")
-
-    with open(current_dir / "all_apps_table.json", "w") as f:
-        json.dump(all_apps_table, f, indent=2, default=str)
     print(f"  Wrote all_apps_table.json ({len(all_apps_table)} unique apps)")
-
-    # Save historical snapshot
-    today = datetime.now().strftime("%Y-%m-%d")
-    snapshots_dir = DATA_DIR / "historical" / "snapshots"
-    snapshots_dir.mkdir(parents=True, exist_ok=True)
-
-    snapshot = build_daily_snapshot(rankings, today)
-    with open(snapshots_dir / f"{today}.json", "w") as f:
-        json.dump(snapshot, f, indent=2)
     print(f"  Wrote snapshot {today}.json")
 
     # Build trends
     trends = build_trends(snapshots_dir)
-    with open(DATA_DIR / "historical" / "trends.json", "w") as f:
-        json.dump(trends, f, indent=2)
+    _dump_json(DATA_DIR / "historical" / "trends.json", trends)
     print(f"  Wrote trends.json ({len(trends['dates'])} data points)")
 
     # Metadata
@@ -494,8 +671,7 @@ def generate_all():
         "country": "US",
         "platform": "iOS",
     }
-    with open(DATA_DIR / "metadata.json", "w") as f:
-        json.dump(metadata, f, indent=2)
+    _dump_json(DATA_DIR / "metadata.json", metadata)
     print(f"  Wrote metadata.json")
 
     print(f"\nDone! Dashboard data ready in {DATA_DIR}/")
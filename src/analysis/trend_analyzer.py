@@ -2,6 +2,11 @@
 Market Trend Analyzer
 Identifies patterns and trends in app performance data
 """
+import hashlib
+import statistics
+from collections import Counter, defaultdict
+
+import orjson
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple
@@ -15,6 +20,9 @@ class TrendAnalyzer:
     def __init__(self, data_dir: str = "data/processed"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        # Content-hash memo for analyze_category_performance; report
+        # pipelines call it repeatedly with the same records
+        self._category_perf_cache: Dict[bytes, pd.DataFrame] = {}
 
     def analyze_category_performance(
         self,
@@ -29,23 +37,55 @@ class TrendAnalyzer:
         Returns:
             DataFrame with category performance metrics
         """
-        df = pd.DataFrame(apps_data)
-
-        if df.empty:
-            return df
-
-        # Group by category
-        category_stats = df.groupby('category').agg({
-            'revenue': ['mean', 'median', 'sum'],
-            'downloads': ['mean', 'median', 'sum'],
-            'rating': 'mean',
-            'app_id': 'count'
-        }).round(2)
-
-        category_stats.columns = ['_'.join(col) for col in category_stats.columns]
-        category_stats = category_stats.rename(columns={'app_id_count': 'app_count'})
+        if not apps_data:
+            return pd.DataFrame()
 
-        return category_stats.sort_values('revenue_sum', ascending=False)
+        # Lists aren't hashable; a cheap content digest keys the memo
+        cache_key = hashlib.blake2b(
+            orjson.dumps(apps_data, default=str), digest_size=8
+        ).digest()
+        cached = self._category_perf_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Single pass over the records; DataFrame construction + groupby
+        # dispatch costs more than the aggregation itself at this size
+        acc = defaultdict(lambda: {
+            'revenues': [], 'downloads': [], 'rating_sum': 0.0, 'count': 0,
+        })
+        for app in apps_data:
+            stats = acc[app.get('category', 'Unknown')]
+            stats['revenues'].append(app.get('revenue', 0) or 0)
+            stats['downloads'].append(app.get('downloads', 0) or 0)
+            stats['rating_sum'] += app.get('rating', 0) or 0
+            stats['count'] += 1
+
+        rows = {}
+        for category, stats in acc.items():
+            n = stats['count']
+            revenues = stats['revenues']
+            downloads = stats['downloads']
+            rows[category] = {
+                'revenue_mean': round(sum(revenues) / n, 2),
+                'revenue_median': round(statistics.median(revenues), 2),
+                'revenue_sum': round(sum(revenues), 2),
+                'downloads_mean': round(sum(downloads) / n, 2),
+                'downloads_median': round(statistics.median(downloads), 2),
+                'downloads_sum': round(sum(downloads), 2),
+                'rating_mean': round(stats['rating_sum'] / n, 2),
+                'app_count': n,
+            }
+
+        # DataFrame only wraps the finished aggregates for the return type
+        category_stats = pd.DataFrame.from_dict(rows, orient='index')
+        category_stats.index.name = 'category'
+        category_stats = category_stats.sort_values('revenue_sum', ascending=False)
+
+        if len(self._category_perf_cache) >= 8:
+            # Drop the oldest entry; insertion order doubles as LRU here
+            self._category_perf_cache.pop(next(iter(self._category_perf_cache)))
+        self._category_perf_cache[cache_key] = category_stats
+        return category_stats
 
     def identify_emerging_trends(
         self,
@@ -66,22 +106,32 @@ class TrendAnalyzer:
 
         # Example: Rising categories
         if 'category' in historical_data.columns:
-            recent_growth = historical_data.groupby('category')['downloads'].pct_change()
-            growing_categories = recent_growth[recent_growth > 0.1].index.unique()
-
-            for category in growing_categories:
-                trends.append({
+            # pct_change() on the groupby keeps the original row index, so
+            # indexing it by category label was wrong; reduce each group to
+            # its latest period-over-period change instead
+            recent = historical_data.tail(lookback_days)
+            growth = recent.groupby('category')['downloads'].apply(
+                lambda s: s.pct_change().iloc[-1]
+            )
+            # Single-row groups produce NaN, which the > filter drops
+            growing = growth[growth > 0.1]
+
+            trends = [
+                {
                     'type': 'category_growth',
                     'category': category,
-                    'growth_rate': recent_growth[category]
-                })
+                    'growth_rate': rate,
+                }
+                for category, rate in growing.items()
+            ]
 
         return trends
 
     def analyze_successful_app_patterns(
         self,
         top_apps: List[Dict],
-        threshold_percentile: int = 90
+        threshold_percentile: int = 90,
+        df: pd.DataFrame = None
     ) -> Dict:
         """
         Identify common patterns in successful apps
@@ -89,20 +139,29 @@ class TrendAnalyzer:
         Args:
             top_apps: List of top-performing apps
             threshold_percentile: Percentile to define "successful"
+            df: Optional pre-built DataFrame of top_apps, to avoid
+                reconstructing one the caller already paid for
 
         Returns:
             Dictionary of identified patterns
         """
-        df = pd.DataFrame(top_apps)
+        if df is None:
+            df = pd.DataFrame(top_apps)
 
         if df.empty:
             return {}
 
+        # Counting goes straight through collections.Counter; the pandas
+        # value_counts round trip costs more than it saves at this size
         patterns = {
             'avg_price': df['price'].mean() if 'price' in df else 0,
-            'common_categories': df['category'].value_counts().head(5).to_dict() if 'category' in df else {},
+            'common_categories': dict(
+                Counter(a['category'] for a in top_apps if 'category' in a).most_common(5)
+            ),
             'avg_rating': df['rating'].mean() if 'rating' in df else 0,
-            'monetization_models': df['monetization'].value_counts().to_dict() if 'monetization' in df else {}
+            'monetization_models': dict(
+                Counter(a['monetization'] for a in top_apps if 'monetization' in a).most_common()
+            )
         }
 
         return patterns
@@ -177,7 +236,7 @@ class TrendAnalyzer:
 
             # Success patterns
             f.write("\n\n## Success Patterns\n\n")
-            patterns = self.analyze_successful_app_patterns(apps_data)
+            patterns = self.analyze_successful_app_patterns(apps_data, df=df)
             for key, value in patterns.items():
                 f.write(f"- **{key}**: {value}\n")
 
@@ -12,17 +12,24 @@ Verified working endpoints (Feb 2025):
 - GET /v1/unified/apps         - Cross-platform app lookup
 """
 import os
-import json
 import time
 import hashlib
+import threading
+import orjson
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter, Retry
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Set CACHE_ENABLED=0 to force every request to the network
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "1") != "0"
+
 
 # Chart type constants
 CHART_TOP_FREE = "topfreeapplications"
@@ -30,12 +37,54 @@ CHART_TOP_PAID = "toppaidapplications"
 CHART_TOP_GROSSING = "topgrossingapplications"
 
 
+def _ids_csv(ids: List) -> str:
+    """Comma-join IDs; C-level map(str) beats a generator expression, and
+    all-string lists (Android package names) skip stringification entirely."""
+    if ids and isinstance(ids[0], str):
+        return ",".join(ids)
+    return ",".join(map(str, ids))
+
+
+class TokenBucket:
+    """Token-bucket rate limiter: bursts up to capacity, steady refill.
+
+    Unlike a fixed inter-request sleep, accumulated credit lets short
+    bursts proceed back-to-back while the long-term rate stays capped.
+    Safe to share across threads.
+    """
+
+    def __init__(self, rate: float, capacity: int = 5):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.last_refill) * self.rate,
+                )
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
 class SensorTowerClient:
     """API client with smart caching to minimize requests"""
 
     BASE_URL = "https://api.sensortower.com/v1"
     _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
     CACHE_DIR = _PROJECT_ROOT / "data" / "raw" / "cache"
+    # Parsed-result entries held in memory in front of the disk cache
+    MEM_CACHE_MAX_ENTRIES = 256
 
     def __init__(
         self,
@@ -48,80 +97,181 @@ class SensorTowerClient:
             raise ValueError("API token required. Set SENSORTOWER_API_TOKEN env variable")
 
         self.cache_ttl = timedelta(hours=cache_ttl_hours)
+        self._cache_ttl_secs = cache_ttl_hours * 3600.0
         self.rate_limit_delay = rate_limit_delay
-        self.last_request_time = 0
+        # rate_limit_delay keeps its meaning as average seconds per request;
+        # the bucket just allows short bursts within that budget
+        self._bucket = TokenBucket(rate=1.0 / rate_limit_delay) if rate_limit_delay > 0 else None
         self.request_count = 0
 
         self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
-        self.usage_log_file = self._PROJECT_ROOT / "data" / "api_usage_log.json"
+        # Persistent session: keep-alive skips the TCP+TLS handshake on
+        # every request after the first, and transient errors are retried
+        self._session = requests.Session()
+        self._session.headers.update({"Authorization": f"Bearer {self.api_token}"})
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=8, pool_maxsize=16,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        ))
+
+        self.usage_log_file = self._PROJECT_ROOT / "data" / "api_usage_log.jsonl"
+        self.usage_counts_file = self._PROJECT_ROOT / "data" / "api_usage_counts.json"
+        # Callers may issue requests from a thread pool; serialize log updates
+        self._usage_lock = threading.Lock()
+        # "%Y-%m" only changes at month rollover; cache it with its expiry
+        self._month_key = ""
+        self._month_key_expiry = 0.0
         self._load_usage_log()
 
+        # In-memory LRU over parsed cache payloads: repeated hits skip the
+        # file read and JSON parse entirely
+        self._mem_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._mem_lock = threading.Lock()
+
+        # A handful of endpoints serve every request; skip re-formatting
+        # the URL on each call
+        self._endpoint_urls: Dict[str, str] = {}
+
     # ---- Usage tracking ----
 
     def _load_usage_log(self):
-        if self.usage_log_file.exists():
-            with open(self.usage_log_file, 'r') as f:
-                self.usage_log = json.load(f)
-        else:
-            self.usage_log = {"requests": [], "monthly_counts": {}}
+        """Load monthly counts; migrate the old single-file log if present.
 
-    def _save_usage_log(self):
-        with open(self.usage_log_file, 'w') as f:
-            json.dump(self.usage_log, f, indent=2)
+        Per-request records live in an append-only JSONL file so logging a
+        request never rewrites history; only the tiny counts dict does.
+        """
+        if self.usage_counts_file.exists():
+            self.monthly_counts = orjson.loads(self.usage_counts_file.read_bytes())
+            return
+
+        legacy_file = self.usage_counts_file.parent / "api_usage_log.json"
+        if legacy_file.exists():
+            legacy = orjson.loads(legacy_file.read_bytes())
+            self.monthly_counts = legacy.get("monthly_counts", {})
+            with open(self.usage_log_file, "ab") as f:
+                for req in legacy.get("requests", []):
+                    f.write(orjson.dumps(req) + b"\n")
+            legacy_file.rename(legacy_file.with_suffix(".json.bak"))
+            self._save_usage_counts()
+        else:
+            self.monthly_counts = {}
+
+    def _save_usage_counts(self):
+        self.usage_counts_file.write_bytes(
+            orjson.dumps(self.monthly_counts, option=orjson.OPT_INDENT_2)
+        )
+
+    def _current_month_key(self) -> str:
+        if time.time() >= self._month_key_expiry:
+            now = datetime.now()
+            self._month_key = now.strftime("%Y-%m")
+            next_month = (
+                datetime(now.year + 1, 1, 1) if now.month == 12
+                else datetime(now.year, now.month + 1, 1)
+            )
+            self._month_key_expiry = next_month.timestamp()
+        return self._month_key
 
     def _log_request(self, endpoint: str):
-        timestamp = datetime.now().isoformat()
-        month_key = datetime.now().strftime("%Y-%m")
+        record = {"timestamp": datetime.now().isoformat(), "endpoint": endpoint}
+        month_key = self._current_month_key()
 
-        self.usage_log["requests"].append({
-            "timestamp": timestamp,
-            "endpoint": endpoint
-        })
+        with self._usage_lock:
+            with open(self.usage_log_file, "ab") as f:
+                f.write(orjson.dumps(record) + b"\n")
 
-        if month_key not in self.usage_log["monthly_counts"]:
-            self.usage_log["monthly_counts"][month_key] = 0
-        self.usage_log["monthly_counts"][month_key] += 1
-
-        self._save_usage_log()
-        self.request_count += 1
+            self.monthly_counts[month_key] = self.monthly_counts.get(month_key, 0) + 1
+            self._save_usage_counts()
+            self.request_count += 1
 
     def get_monthly_usage(self, month: Optional[str] = None) -> int:
         if month is None:
-            month = datetime.now().strftime("%Y-%m")
-        return self.usage_log["monthly_counts"].get(month, 0)
+            month = self._current_month_key()
+        return self.monthly_counts.get(month, 0)
 
     # ---- Caching ----
 
     def _get_cache_key(self, endpoint: str, params: Dict) -> str:
-        cache_str = f"{endpoint}:{json.dumps(params, sort_keys=True)}"
-        return hashlib.md5(cache_str.encode()).hexdigest()
+        # Feed the canonical (sorted) param pairs straight into the hash;
+        # the JSON encoder only existed to produce a stable string
+        h = hashlib.blake2b(endpoint.encode(), digest_size=16)
+        for key in sorted(params):
+            h.update(key.encode())
+            h.update(b"=")
+            h.update(str(params[key]).encode())
+            h.update(b"&")
+        return h.hexdigest()
 
     def _get_cache_path(self, cache_key: str) -> Path:
-        return self.CACHE_DIR / f"{cache_key}.json"
+        # Shard by the first two hex chars (256 buckets) so no single
+        # directory grows wide enough to slow lookups and listings
+        return self.CACHE_DIR / cache_key[:2] / f"{cache_key}.json"
 
     def _is_cache_valid(self, cache_path: Path) -> bool:
-        if not cache_path.exists():
+        # One stat covers both existence and freshness; float arithmetic
+        # avoids building datetime objects on every probe
+        try:
+            return (time.time() - cache_path.stat().st_mtime) < self._cache_ttl_secs
+        except FileNotFoundError:
             return False
-        modified_time = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        return datetime.now() - modified_time < self.cache_ttl
+
+    def _mem_cache_put(self, cache_key: str, data: Any, cached_at: Optional[float] = None):
+        with self._mem_lock:
+            self._mem_cache[cache_key] = (cached_at or time.time(), data)
+            self._mem_cache.move_to_end(cache_key)
+            while len(self._mem_cache) > self.MEM_CACHE_MAX_ENTRIES:
+                self._mem_cache.popitem(last=False)
 
     def _get_from_cache(self, cache_key: str) -> Optional[Any]:
+        ttl_secs = self._cache_ttl_secs
+
+        with self._mem_lock:
+            entry = self._mem_cache.get(cache_key)
+            if entry is not None:
+                cached_at, data = entry
+                if time.time() - cached_at < ttl_secs:
+                    self._mem_cache.move_to_end(cache_key)
+                    return data
+                del self._mem_cache[cache_key]
+
         cache_path = self._get_cache_path(cache_key)
         if self._is_cache_valid(cache_path):
-            with open(cache_path, 'r') as f:
-                cached = json.load(f)
-                print(f"  [cache hit] {cache_key[:8]}...")
-                return cached["data"]
+            cached = orjson.loads(cache_path.read_bytes())
+            print(f"  [cache hit] {cache_key[:8]}...")
+            data = cached["data"]
+            # Age the memory entry from the file's mtime so both layers
+            # expire together
+            self._mem_cache_put(cache_key, data, cached_at=cache_path.stat().st_mtime)
+            return data
         return None
 
-    def _save_to_cache(self, cache_key: str, data: Any):
+    def _save_to_cache(self, cache_key: str, data: Any, response_headers: Optional[Any] = None):
         cache_path = self._get_cache_path(cache_key)
-        with open(cache_path, 'w') as f:
-            json.dump({
-                "cached_at": datetime.now().isoformat(),
-                "data": data
-            }, f, indent=2)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "cached_at": datetime.now().isoformat(),
+            "data": data
+        }
+        # Validators enable cheap revalidation once the TTL lapses
+        if response_headers is not None:
+            entry["etag"] = response_headers.get("ETag")
+            entry["last_modified"] = response_headers.get("Last-Modified")
+        # Compact bytes: the cache is machine-read only, and smaller files
+        # mean less disk I/O on both sides of the round trip
+        cache_path.write_bytes(orjson.dumps(entry))
+        # Write-through: the next lookup in this process stays in memory
+        self._mem_cache_put(cache_key, data)
+
+    def _read_stale_cache(self, cache_path: Path) -> Optional[Dict]:
+        """Expired-but-present entry, used for conditional revalidation."""
+        try:
+            return orjson.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
 
     # ---- Core request method ----
 
@@ -134,18 +284,45 @@ class SensorTowerClient:
         params = params or {}
         cache_key = self._get_cache_key(endpoint, params)
 
-        if use_cache:
+        # Cache hits return here and never touch the rate limiter
+        if use_cache and CACHE_ENABLED:
             cached_data = self._get_from_cache(cache_key)
             if cached_data is not None:
                 return cached_data
 
-        # Rate limiting
-        time_since_last = time.time() - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last)
+        return self._network_fetch(
+            endpoint, params, cache_key,
+            revalidate=use_cache and CACHE_ENABLED,
+        )
+
+    def _network_fetch(
+        self,
+        endpoint: str,
+        params: Dict,
+        cache_key: str,
+        revalidate: bool = False
+    ) -> Any:
+        """Cache-miss path: rate limit, fetch, log and persist.
+
+        With revalidate=True, an expired cache entry's validators are sent
+        as a conditional request; a 304 refreshes the entry's TTL and
+        reuses the cached body without transferring or parsing a payload.
+        """
+        cache_path = self._get_cache_path(cache_key)
+        stale = self._read_stale_cache(cache_path) if revalidate else None
+        cond_headers = {}
+        if stale:
+            if stale.get("etag"):
+                cond_headers["If-None-Match"] = stale["etag"]
+            if stale.get("last_modified"):
+                cond_headers["If-Modified-Since"] = stale["last_modified"]
+
+        if self._bucket is not None:
+            self._bucket.acquire()
 
-        url = f"{self.BASE_URL}/{endpoint}"
-        headers = {"Authorization": f"Bearer {self.api_token}"}
+        url = self._endpoint_urls.get(endpoint)
+        if url is None:
+            url = self._endpoint_urls.setdefault(endpoint, f"{self.BASE_URL}/{endpoint}")
 
         usage = self.get_monthly_usage()
         print(f"  [API call] {endpoint} (monthly usage: {usage})")
@@ -153,13 +330,26 @@ class SensorTowerClient:
         if usage >= 2000:
             print(f"  WARNING: Monthly usage is {usage}/2500!")
 
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        self.last_request_time = time.time()
+        response = self._session.get(
+            url, params=params, timeout=30,
+            headers=cond_headers or None,
+        )
+        if response.status_code == 304 and stale is not None:
+            # Unchanged upstream: extend the entry's life and reuse it.
+            # Conditional hits still count toward the monthly quota.
+            self._log_request(endpoint)
+            os.utime(cache_path)
+            data = stale["data"]
+            self._mem_cache_put(cache_key, data)
+            return data
+
         response.raise_for_status()
-        data = response.json()
+        # Parse the raw bytes with orjson; response.json() goes through
+        # charset detection and the stdlib parser
+        data = orjson.loads(response.content)
 
         self._log_request(endpoint)
-        self._save_to_cache(cache_key, data)
+        self._save_to_cache(cache_key, data, response.headers)
 
         return data
 
@@ -223,8 +413,33 @@ class SensorTowerClient:
 
         return result
 
+    def get_top_apps_bulk(
+        self,
+        specs: List[Dict],
+        max_workers: int = 8
+    ) -> List[Dict]:
+        """
+        Fetch several charts concurrently.
+
+        Cold-cache calls overlap their network round trips on a thread
+        pool; the token bucket still caps the aggregate request rate and
+        the usage log is lock-protected, so this is safe to use freely.
+
+        Args:
+            specs: List of keyword-argument dicts for get_top_apps
+            max_workers: Thread pool size
+
+        Returns:
+            Chart results in the same order as specs
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda spec: self.get_top_apps(**spec), specs))
+
     # ---- App Details ----
 
+    # Max IDs per request; keeps URLs well under provider/length limits
+    DETAILS_BATCH_SIZE = 100
+
     def get_app_details(
         self,
         app_ids: List,
@@ -234,6 +449,10 @@ class SensorTowerClient:
         """
         Get details for multiple apps.
 
+        ID lists longer than DETAILS_BATCH_SIZE are split into one request
+        per batch; each batch caches independently, so partial hits still
+        save calls.
+
         Args:
             app_ids: List of app IDs (iTunes IDs for iOS, package names for Android)
             device: 'ios' or 'android'
@@ -242,12 +461,15 @@ class SensorTowerClient:
         Returns:
             List of app detail dicts
         """
-        ids_str = ",".join(str(x) for x in app_ids)
-        params = {"app_ids": ids_str}
         endpoint = f"{device}/apps"
 
-        data = self._make_request(endpoint, params, use_cache)
-        return data.get("apps", [])
+        apps: List[Dict] = []
+        for i in range(0, len(app_ids), self.DETAILS_BATCH_SIZE):
+            batch = app_ids[i:i + self.DETAILS_BATCH_SIZE]
+            params = {"app_ids": _ids_csv(batch)}
+            data = self._make_request(endpoint, params, use_cache)
+            apps.extend(data.get("apps", []))
+        return apps
 
     # ---- Sales / Revenue / Download Estimates ----
 
@@ -296,9 +518,9 @@ class SensorTowerClient:
         }
 
         if app_ids:
-            params["app_ids"] = ",".join(str(x) for x in app_ids)
+            params["app_ids"] = _ids_csv(app_ids)
         if publisher_ids:
-            params["publisher_ids"] = ",".join(str(x) for x in publisher_ids)
+            params["publisher_ids"] = _ids_csv(publisher_ids)
         if country:
             params["country"] = country
 
@@ -325,7 +547,7 @@ class SensorTowerClient:
             List of unified app records with cross-platform mappings
         """
         params = {
-            "app_ids": ",".join(str(x) for x in app_ids),
+            "app_ids": _ids_csv(app_ids),
             "app_id_type": app_id_type,
         }
         endpoint = "unified/apps"
@@ -335,13 +557,27 @@ class SensorTowerClient:
     # ---- Cache management ----
 
     def clear_old_cache(self, days: int = 30):
-        cutoff = datetime.now() - timedelta(days=days)
+        # scandir's DirEntry caches stat results, so each file costs one
+        # syscall instead of the glob + stat pair
+        cutoff = time.time() - days * 86400.0
         removed = 0
-        for cache_file in self.CACHE_DIR.glob("*.json"):
-            modified_time = datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if modified_time < cutoff:
-                cache_file.unlink()
-                removed += 1
+
+        def _sweep(dir_path):
+            swept = 0
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        swept += 1
+            return swept
+
+        # Shard subdirectories plus any flat files from the old layout
+        with os.scandir(self.CACHE_DIR) as it:
+            subdirs = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+        removed += _sweep(self.CACHE_DIR)
+        for subdir in subdirs:
+            removed += _sweep(subdir)
+
         print(f"Removed {removed} old cache files")
         return removed
 
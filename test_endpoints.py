@@ -4,6 +4,8 @@ Use this to find the correct endpoints for your subscription
 """
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,6 +15,14 @@ if not API_TOKEN:
     print("ERROR: SENSORTOWER_API_TOKEN not found in .env")
     exit(1)
 
+# Shared pooled session so parallel probes reuse TLS connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_maxsize=8))
+SESSION.headers.update({
+    "Authorization": f"Bearer {API_TOKEN}",
+    "Content-Type": "application/json"
+})
+
 print("=" * 70)
 print("SensorTower API Endpoint Explorer")
 print("=" * 70)
@@ -60,48 +70,59 @@ test_endpoints = [
     },
 ]
 
-headers = {
-    "Authorization": f"Bearer {API_TOKEN}",
-    "Content-Type": "application/json"
-}
-
-successful_endpoints = []
-
-for i, endpoint in enumerate(test_endpoints, 1):
+def probe(endpoint):
+    """Test one endpoint; returns (report lines, success record or None)."""
     url = endpoint["url"]
     params = endpoint["params"]
-
-    print(f"[{i}/{len(test_endpoints)}] Testing: {url}")
+    lines = []
+    success = None
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = SESSION.get(url, params=params, timeout=10)
         status = response.status_code
 
         if status == 200:
-            print(f"  ✅ SUCCESS (200)")
-            print(f"  Response preview: {str(response.json())[:100]}...")
-            successful_endpoints.append({
+            # Parse once; each response.json() call redoes the full parse
+            body = response.json()
+            lines.append(f"  ✅ SUCCESS (200)")
+            lines.append(f"  Response preview: {str(body)[:100]}...")
+            success = {
                 "url": url,
                 "params": params,
-                "response_keys": list(response.json().keys()) if isinstance(response.json(), dict) else "list"
-            })
+                "response_keys": list(body.keys()) if isinstance(body, dict) else "list"
+            }
         elif status == 401:
-            print(f"  ❌ UNAUTHORIZED (401) - Check API token")
+            lines.append(f"  ❌ UNAUTHORIZED (401) - Check API token")
         elif status == 404:
-            print(f"  ❌ NOT FOUND (404) - Wrong endpoint")
+            lines.append(f"  ❌ NOT FOUND (404) - Wrong endpoint")
         elif status == 403:
-            print(f"  ❌ FORBIDDEN (403) - Not included in your plan")
+            lines.append(f"  ❌ FORBIDDEN (403) - Not included in your plan")
         else:
-            print(f"  ⚠️  Status: {status}")
+            lines.append(f"  ⚠️  Status: {status}")
             if response.text:
-                print(f"  Message: {response.text[:100]}")
+                lines.append(f"  Message: {response.text[:100]}")
 
     except requests.exceptions.Timeout:
-        print(f"  ⏱️  TIMEOUT")
+        lines.append(f"  ⏱️  TIMEOUT")
     except Exception as e:
-        print(f"  ❌ ERROR: {str(e)[:50]}")
+        lines.append(f"  ❌ ERROR: {str(e)[:50]}")
+
+    return lines, success
+
+
+successful_endpoints = []
+
+# Probes are independent; overlap the round trips and print in order
+with ThreadPoolExecutor(max_workers=8) as pool:
+    reports = list(pool.map(probe, test_endpoints))
 
+for i, (endpoint, (lines, success)) in enumerate(zip(test_endpoints, reports), 1):
+    print(f"[{i}/{len(test_endpoints)}] Testing: {endpoint['url']}")
+    for line in lines:
+        print(line)
     print()
+    if success:
+        successful_endpoints.append(success)
 
 # Summary
 print("=" * 70)